@@ -1,10 +1,17 @@
 """Profile loader for configurable pipeline behavior."""
 
+import copy
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class ProfileConfig:
@@ -63,6 +70,22 @@ def get_profiles_dir() -> Path:
     return profiles_dir
 
 
+@lru_cache(maxsize=32)
+def _parse_profile_file(path: str, mtime_ns: int) -> Any:
+    """Parse a profile YAML file, cached per path and modification time.
+    
+    mtime_ns is part of the cache key only, so an edited file is re-read.
+    Callers must not mutate the returned data.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def clear_profile_cache() -> None:
+    """Drop cached profile YAML so the next load re-reads from disk."""
+    _parse_profile_file.cache_clear()
+
+
 def load_profile(profile_name: str = "default") -> ProfileConfig:
     """Load a configuration profile.
     
@@ -83,13 +106,13 @@ def load_profile(profile_name: str = "default") -> ProfileConfig:
         raise FileNotFoundError(f"Profile not found: {profile_name} (expected at {profile_path})")
     
     try:
-        with open(profile_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = _parse_profile_file(str(profile_path), profile_path.stat().st_mtime_ns)
         
         if not data:
             raise ValueError(f"Profile file is empty: {profile_path}")
         
-        return ProfileConfig.from_dict(data)
+        # Fresh copy: callers may change the returned profile (set_table_parser_mode)
+        return ProfileConfig.from_dict(copy.deepcopy(data))
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in profile {profile_name}: {e}")
     except Exception as e:
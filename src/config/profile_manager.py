@@ -1,7 +1,7 @@
 """Global profile manager for pipeline configuration."""
 
 from typing import Optional
-from .profile_loader import ProfileConfig, load_profile, get_default_profile
+from .profile_loader import ProfileConfig, clear_profile_cache, load_profile, get_default_profile
 
 # Global profile instance
 _current_profile: Optional[ProfileConfig] = None
@@ -38,6 +38,7 @@ def get_profile() -> ProfileConfig:
 
 
 def reset_profile():
-    """Reset to default profile."""
+    """Reset to default profile and drop cached profile files."""
     global _current_profile
     _current_profile = None
+    clear_profile_cache()
@@ -15,6 +15,11 @@ from .artifact_manifest import ArtifactManifest, calculate_file_hash
 logger = logging.getLogger(__name__)
 
 
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write data as indented UTF-8 JSON in a single write."""
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
 def save_table_debug_artifacts(
     artifacts_dir: Path,
     invoice_id: str,
@@ -51,9 +56,10 @@ def save_table_debug_artifacts(
     
     # 1. Save table_block_raw_text.txt
     raw_text_path = debug_dir / "table_block_raw_text.txt"
-    with open(raw_text_path, 'w', encoding='utf-8') as f:
-        for row in table_rows:
-            f.write(row.text + '\n')
+    raw_text_path.write_text(
+        ''.join(row.text + '\n' for row in table_rows),
+        encoding='utf-8'
+    )
     
     # 2. Save parsed_lines.json
     parsed_lines_path = debug_dir / "parsed_lines.json"
@@ -75,8 +81,7 @@ def save_table_debug_artifacts(
             for line in line_items
         ]
     }
-    with open(parsed_lines_path, 'w', encoding='utf-8') as f:
-        json.dump(parsed_lines_data, f, indent=2, ensure_ascii=False)
+    _write_json(parsed_lines_path, parsed_lines_data)
     
     # 3. Save validation_result.json
     validation_result_path = debug_dir / "validation_result.json"
@@ -106,8 +111,7 @@ def save_table_debug_artifacts(
         'errors': validation_result.errors,
         'warnings': validation_result.warnings,
     }
-    with open(validation_result_path, 'w', encoding='utf-8') as f:
-        json.dump(validation_data, f, indent=2, ensure_ascii=False)
+    _write_json(validation_result_path, validation_data)
     
     # 4. Save table_block_tokens.json (optional, for advanced debugging)
     tokens_path = debug_dir / "table_block_tokens.json"
@@ -137,8 +141,7 @@ def save_table_debug_artifacts(
             for idx, row in enumerate(table_rows)
         ]
     }
-    with open(tokens_path, 'w', encoding='utf-8') as f:
-        json.dump(tokens_data, f, indent=2, ensure_ascii=False)
+    _write_json(tokens_path, tokens_data)
     
     logger.info(
         f"Saved table debug artifacts for invoice {invoice_id} to {debug_dir}"
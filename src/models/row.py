@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 if TYPE_CHECKING:
     from .page import Page
     from .token import Token
 
 
-@dataclass
+@dataclass(slots=True)
 class Row:
     """Represents a logical row with tokens grouped by Y-position.
     
@@ -24,6 +24,9 @@ class Row:
         x_max: Maximum X-coordinate in row
         text: Concatenated text from all tokens (CONVENIENCE only)
         page: Reference to parent Page
+        y_min: Optional top edge of the row; None means use y
+        y_max: Optional bottom edge of the row; None means y + token height
+        text_lower: text.lower(), computed once for keyword matching
     """
     
     tokens: List[Token]
@@ -32,6 +35,9 @@ class Row:
     x_max: float
     text: str
     page: Page
+    y_min: Optional[float] = None
+    y_max: Optional[float] = None
+    text_lower: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate that row has tokens."""
@@ -43,3 +49,5 @@ class Row:
             raise ValueError(
                 f"Row x_min ({self.x_min}) must be <= x_max ({self.x_max})"
             )
+        
+        self.text_lower = self.text.lower()
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from .row import Row
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """Represents a logical document section (header, items, footer).
     
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
@@ -9,7 +10,7 @@ if TYPE_CHECKING:
     from .page import Page
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """Represents a text unit with spatial information (position and dimensions).
     
@@ -41,9 +42,15 @@ class Token:
     confidence: Optional[float] = None  # 0–100 from Tesseract; None when from pdfplumber
     
     def __post_init__(self):
-        """Validate bbox dimensions are non-negative."""
+        """Validate bbox dimensions are non-negative and intern repeated strings."""
         if self.width < 0 or self.height < 0:
             raise ValueError(
                 f"Token dimensions must be non-negative: "
                 f"width={self.width}, height={self.height}"
             )
+        
+        # Units, VAT rates, column headers and font names repeat on every row;
+        # share one str object per distinct value
+        self.text = sys.intern(self.text)
+        if self.font_name is not None:
+            self.font_name = sys.intern(self.font_name)
@@ -21,8 +21,12 @@ from __future__ import annotations
 import logging
 import statistics
 import unicodedata
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from ..models.row import Row
 from ..models.token import Token
@@ -46,27 +50,25 @@ def _norm_text(s: str) -> str:
     return s
 
 
-def _median_abs_deviation(values: List[float]) -> float:
-    if not values:
-        return 0.0
-    m = statistics.median(values)
-    abs_dev = [abs(v - m) for v in values]
-    return statistics.median(abs_dev)
+def _sorted_median(sorted_values: np.ndarray) -> float:
+    """Median of an already sorted, non-empty array (same result as statistics.median)."""
+    n = sorted_values.size
+    return float((sorted_values[(n - 1) // 2] + sorted_values[n // 2]) / 2.0)
 
 
-def _iqr_bounds(values: List[float], k: float = 1.5) -> Tuple[float, float]:
-    """Compute Tukey IQR bounds for outlier filtering."""
-    if len(values) < 4:
-        m = statistics.median(values) if values else 0.0
+def _iqr_bounds(sorted_values: np.ndarray, k: float = 1.5) -> Tuple[float, float]:
+    """Compute Tukey IQR bounds for outlier filtering (input sorted ascending)."""
+    n = sorted_values.size
+    if n < 4:
+        m = _sorted_median(sorted_values) if n else 0.0
         return (m - 1e9, m + 1e9)
 
-    sorted_vals = sorted(values)
-    mid = len(sorted_vals) // 2
-    lower = sorted_vals[:mid]
-    upper = sorted_vals[mid:] if len(sorted_vals) % 2 == 0 else sorted_vals[mid + 1 :]
+    mid = n // 2
+    lower = sorted_values[:mid]
+    upper = sorted_values[mid:] if n % 2 == 0 else sorted_values[mid + 1 :]
 
-    q1 = statistics.median(lower) if lower else sorted_vals[0]
-    q3 = statistics.median(upper) if upper else sorted_vals[-1]
+    q1 = _sorted_median(lower)
+    q3 = _sorted_median(upper)
     iqr = max(q3 - q1, 0.0)
     lo = q1 - k * iqr
     hi = q3 + k * iqr
@@ -113,8 +115,8 @@ def _row_weight(row: Row) -> float:
 
 def _weighted_sample(values: List[float], weights: List[float]) -> List[float]:
     """
-    Expand values by integer-ish weights for robust median calculations
-    without bringing in numpy. Keeps it bounded.
+    Expand values by integer-ish weights for robust median calculations.
+    Keeps it bounded.
     """
     out: List[float] = []
     for v, w in zip(values, weights):
@@ -152,6 +154,17 @@ def _build_boundaries(centers: List[float], page_width: float, margin_left: floa
     return b
 
 
+@lru_cache(maxsize=64)
+def _column_spans(centers: Tuple[float, ...], page_width: float) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Sorted centers and their boundaries, shared by every row of a table.
+
+    Mode B assigns each row against the same centers, so this is computed once
+    per table instead of once per row.
+    """
+    sorted_centers = sorted(centers)
+    return tuple(sorted_centers), tuple(_build_boundaries(sorted_centers, page_width))
+
+
 def _span_overlap(a_left: float, a_right: float, b_left: float, b_right: float) -> float:
     """Return overlap length."""
     left = max(a_left, b_left)
@@ -159,6 +172,31 @@ def _span_overlap(a_left: float, a_right: float, b_left: float, b_right: float)
     return max(0.0, right - left)
 
 
+# Below this many token x column pairs the per-token bisect loop beats NumPy's
+# per-call overhead (crossover measured around 10 tokens x 10 columns)
+_VECTORIZE_MIN_CELLS = 100
+
+
+def _best_columns_array(tokens: List[Token], centers: Sequence[float], boundaries: Sequence[float]) -> List[int]:
+    """Vectorized assign_tokens_to_columns: max overlap, else nearest center.
+
+    argmax/argmin return the first index on ties, matching the scalar loop.
+    """
+    left = np.fromiter((float(t.x) for t in tokens), dtype=np.float64, count=len(tokens))
+    right = left + np.fromiter((float(t.width) for t in tokens), dtype=np.float64, count=len(tokens))
+    b = np.asarray(boundaries, dtype=np.float64)
+
+    overlap = np.minimum(right[:, None], b[None, 1:]) - np.maximum(left[:, None], b[None, :-1])
+    np.maximum(overlap, 0.0, out=overlap)
+    best = overlap.argmax(axis=1)
+    has_overlap = overlap[np.arange(len(tokens)), best] > 0.0
+    if not has_overlap.all():
+        t_center = left + (right - left) / 2.0
+        nearest = np.abs(np.asarray(centers)[None, :] - t_center[:, None]).argmin(axis=1)
+        best = np.where(has_overlap, best, nearest)
+    return best.tolist()
+
+
 # ----------------------------
 # Column Detection
 # ----------------------------
@@ -187,54 +225,51 @@ def detect_columns_gap_based(
         return []
 
     # Filter pathological outliers in x-centers (caused by bad token boxes)
-    lo, hi = _iqr_bounds(x_centers, k=2.0)
-    x_centers = [x for x in x_centers if lo <= x <= hi] or x_centers
-
-    x_centers.sort()
+    xs = np.sort(np.asarray(x_centers, dtype=np.float64))
+    lo, hi = _iqr_bounds(xs, k=2.0)
+    kept = xs[(xs >= lo) & (xs <= hi)]
+    if kept.size:
+        xs = kept
 
     # Compute inter-center gaps
-    raw_gaps = [x_centers[i + 1] - x_centers[i] for i in range(len(x_centers) - 1)]
-    if not raw_gaps:
-        return [statistics.median(x_centers)]
+    raw_gaps = np.diff(xs)
+    if not raw_gaps.size:
+        return [float(xs[0])]
 
     # Adaptive threshold:
     # - Start from provided min_gap
     # - If PDF is tight/packed, min_gap may be too large; if noisy, too small
-    med_gap = statistics.median(raw_gaps)
-    mad_gap = _median_abs_deviation(raw_gaps)
+    med_gap = _sorted_median(np.sort(raw_gaps))
+    mad_gap = _sorted_median(np.sort(np.abs(raw_gaps - med_gap)))
     # A robust "large gap" heuristic:
     # - large if > max(min_gap, med_gap + 2.5*MAD) but keep a floor on MAD
     adaptive = med_gap + 2.5 * max(mad_gap, 2.0)
     gap_threshold = max(float(min_gap), adaptive)
 
     # Identify "large gaps" as potential boundaries
-    gap_candidates: List[Tuple[float, float, float]] = []
-    for i, g in enumerate(raw_gaps):
-        if g >= gap_threshold:
-            gap_candidates.append((x_centers[i], x_centers[i + 1], g))
+    gap_sizes = raw_gaps[raw_gaps >= gap_threshold]
 
     # If too many boundaries, raise threshold further (over-splitting control)
-    if len(gap_candidates) > 12:
-        gap_sizes = [g for _, _, g in gap_candidates]
+    if gap_sizes.size > 12:
         # Raise to a high quantile to keep only the strongest separators
-        gap_sizes_sorted = sorted(gap_sizes)
-        q = gap_sizes_sorted[int(0.75 * (len(gap_sizes_sorted) - 1))]
+        gap_sizes_sorted = np.sort(gap_sizes)
+        q = float(gap_sizes_sorted[int(0.75 * (gap_sizes_sorted.size - 1))])
         gap_threshold2 = max(gap_threshold, q)
-        gap_candidates = [c for c in gap_candidates if c[2] >= gap_threshold2]
         logger.debug(
             "Gap over-splitting: %d candidates -> %d after threshold %.1fpt (q75=%.1fpt, base=%.1fpt)",
-            len(gap_sizes),
-            len(gap_candidates),
+            gap_sizes.size,
+            int(np.count_nonzero(gap_sizes >= gap_threshold2)),
             gap_threshold2,
             q,
             gap_threshold,
         )
         gap_threshold = gap_threshold2
 
-    # Convert gaps to cluster segments, then choose centers as medians of each segment
-    if not gap_candidates:
+    # Break after every gap at or above the final threshold
+    break_indices = np.flatnonzero(raw_gaps >= gap_threshold)
+    if not break_indices.size:
         # single column: median x
-        center = statistics.median(x_centers)
+        center = _sorted_median(xs)
         logger.debug(
             "No column gaps found (min_gap=%.1f, adaptive=%.1f => thr=%.1f). Single column @ %.1f",
             min_gap,
@@ -244,26 +279,10 @@ def detect_columns_gap_based(
         )
         return [center]
 
-    # Determine breakpoints in x_centers based on gap_candidates
-    breaks = set()
-    for left_x, right_x, _ in gap_candidates:
-        # break between left_x and right_x
-        # find index i where x[i]==left_x and x[i+1]==right_x
-        # since floats may not match exactly, do nearest search
-        # We'll approximate by scanning raw_gaps threshold again.
-        pass
-
-    # Re-scan raw_gaps to find break indices using final threshold
-    break_indices = [i for i, g in enumerate(raw_gaps) if g >= gap_threshold]
-
     # Build clusters [start..end]
-    clusters: List[List[float]] = []
-    start = 0
-    for i in break_indices:
-        end = i + 1
-        clusters.append(x_centers[start:end])
-        start = end
-    clusters.append(x_centers[start:])
+    x_sorted = xs.tolist()
+    bounds = [0, *(break_indices + 1).tolist(), len(x_sorted)]
+    clusters: List[List[float]] = [x_sorted[a:b] for a, b in zip(bounds, bounds[1:])]
 
     # Remove tiny clusters that are likely noise (e.g., stray token)
     # Merge tiny cluster into nearest neighbor
@@ -441,15 +460,18 @@ def assign_tokens_to_columns(
     if not column_centers:
         return {}
 
-    centers = sorted(column_centers)
-    page_w = _safe_page_width([row])
-    boundaries = _build_boundaries(centers, page_w)
+    centers, boundaries = _column_spans(tuple(column_centers), _safe_page_width([row]))
 
     # Initialize
     column_tokens: Dict[int, List[Token]] = {i: [] for i in range(len(centers))}
     if not row.tokens:
         return column_tokens
 
+    if len(row.tokens) * len(centers) >= _VECTORIZE_MIN_CELLS:
+        for token, col in zip(row.tokens, _best_columns_array(row.tokens, centers, boundaries)):
+            column_tokens[col].append(token)
+        return column_tokens
+
     for token in row.tokens:
         t_left = float(token.x)
         t_right = float(token.x) + float(token.width)
@@ -458,8 +480,11 @@ def assign_tokens_to_columns(
         best_col = None
         best_overlap = 0.0
 
-        # overlap with each column span
-        for i in range(len(centers)):
+        # overlap with each column span; boundaries are strictly increasing,
+        # so only spans between the token's left and right edges can overlap
+        first = max(bisect_right(boundaries, t_left) - 1, 0)
+        last = min(bisect_left(boundaries, t_right), len(centers))
+        for i in range(first, last):
             c_left = boundaries[i]
             c_right = boundaries[i + 1]
             ov = _span_overlap(t_left, t_right, c_left, c_right)
@@ -468,8 +493,13 @@ def assign_tokens_to_columns(
                 best_col = i
 
         if best_col is None or best_overlap <= 0.0:
-            # fallback: nearest center
-            best_col = min(range(len(centers)), key=lambda i: abs(centers[i] - t_center))
+            # fallback: nearest center (lowest index on ties, as with min())
+            best_col = bisect_left(centers, t_center)
+            if best_col == len(centers) or (
+                best_col > 0
+                and abs(centers[best_col - 1] - t_center) <= abs(centers[best_col] - t_center)
+            ):
+                best_col = bisect_left(centers, centers[best_col - 1])
 
         # Optional: if token overlaps heavily across columns, keep it where overlap is largest.
         column_tokens[int(best_col)].append(token)
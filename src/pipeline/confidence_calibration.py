@@ -22,11 +22,15 @@ import re
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import joblib
 import numpy as np
-from sklearn.isotonic import IsotonicRegression
+
+if TYPE_CHECKING:
+    from sklearn.isotonic import IsotonicRegression
+
+# joblib and sklearn are imported where they are used (save/load/train) so that
+# importing the pipeline does not pay for them when calibration is disabled.
 
 logger = logging.getLogger(__name__)
 
@@ -200,6 +204,7 @@ class CalibrationModel:
             'model': self.model,
             'metadata': self.metadata
         }
+        import joblib
         joblib.dump(data, path)
         logger.info(f"Calibration model saved to {path}")
     
@@ -217,6 +222,8 @@ class CalibrationModel:
                 return None
         
         try:
+            import joblib
+            from sklearn.isotonic import IsotonicRegression
             data = joblib.load(path)
             
             # Handle both old format (just model) and new format (dict with metadata)
@@ -455,6 +462,7 @@ def train_calibration_model(
         return None
     
     # CAL-02: Train isotonic regression with sample weights
+    from sklearn.isotonic import IsotonicRegression
     model = IsotonicRegression(out_of_bounds='clip', increasing=True)
     model.fit(X_agg, y_agg, sample_weight=w_agg)
     
@@ -19,6 +19,40 @@ _AMOUNT_PATTERN = re.compile(
 )
 
 
+# Total-amount keywords by priority, matched as substrings of the lowercased row
+# Highest priority: "att betala" / "inkl. moms" (total WITH VAT)
+_HIGH_PRIORITY_TOTAL_KEYWORDS = (
+    "att betala", "attbetala", "att betala sek", "attbetala sek",
+    "summa att betala", "summa attbetala", "summa att betala sek",
+    "belopp att betala", "belopp attbetala", "belopp att betala sek",
+    "betalningsbelopp", "betalningsbeloppet", "betalningsbelopp sek",
+    "totalt inkl. moms", "total inkl. moms", "totalt inklusive moms",
+    "total inklusive moms", "totalt inkl moms", "total inkl moms",
+    "inkl. moms", "inklusive moms", "inkl moms",
+    "totalt med moms", "total med moms", "med moms",
+    "totalt moms inkluderad", "total moms inkluderad",
+    "betalas", "betalas sek", "belopp betalas",
+    "slutsumma inkl. moms", "netto att betala", "netto betalas",
+)
+
+# Medium priority: generic totals
+_MEDIUM_PRIORITY_TOTAL_KEYWORDS = (
+    "totalt", "total", "summa", "belopp", "slutsumma",
+    "fakturabelopp", "fakturabeloppet",
+    "nettobelopp", "nettobeloppet",
+)
+
+# Lower priority: "exkl. moms" (subtotal, not final total)
+_LOW_PRIORITY_TOTAL_KEYWORDS = (
+    "totalt exkl. moms", "total exkl. moms", "totalt exklusive moms",
+    "total exklusive moms", "totalt exkl moms", "total exkl moms",
+    "exkl. moms", "exklusive moms", "exkl moms",
+    "totalt utan moms", "total utan moms", "utan moms",
+    "delsumma", "subtotal", "summa exkl. moms", "summa exklusive moms",
+    "momsfri summa", "momsfritt belopp", "netto exkl. moms",
+)
+
+
 def _to_decimal(value) -> Optional[Decimal]:
     if value is None:
         return None
@@ -69,57 +103,25 @@ def score_total_amount_candidate(
     # Keyword match (0.32 weight, reduced from 0.35)
     # Prioritize "with VAT" keywords (what customer actually pays)
     # Check in order of priority (most specific first)
-    row_lower = row.text.lower()
-    
-    # Highest priority: "att betala" / "inkl. moms" (total WITH VAT)
-    high_priority_keywords = [
-        "att betala", "attbetala", "att betala sek", "attbetala sek",
-        "summa att betala", "summa attbetala", "summa att betala sek",
-        "belopp att betala", "belopp attbetala", "belopp att betala sek",
-        "betalningsbelopp", "betalningsbeloppet", "betalningsbelopp sek",
-        "totalt inkl. moms", "total inkl. moms", "totalt inklusive moms",
-        "total inklusive moms", "totalt inkl moms", "total inkl moms",
-        "inkl. moms", "inklusive moms", "inkl moms",
-        "totalt med moms", "total med moms", "med moms",
-        "totalt moms inkluderad", "total moms inkluderad",
-        "betalas", "betalas sek", "belopp betalas",
-        "slutsumma inkl. moms", "netto att betala", "netto betalas"
-    ]
-    
-    # Medium priority: generic totals
-    medium_priority_keywords = [
-        "totalt", "total", "summa", "belopp", "slutsumma",
-        "fakturabelopp", "fakturabeloppet",
-        "nettobelopp", "nettobeloppet",
-    ]
-    
-    # Lower priority: "exkl. moms" (subtotal, not final total)
-    low_priority_keywords = [
-        "totalt exkl. moms", "total exkl. moms", "totalt exklusive moms",
-        "total exklusive moms", "totalt exkl moms", "total exkl moms",
-        "exkl. moms", "exklusive moms", "exkl moms",
-        "totalt utan moms", "total utan moms", "utan moms",
-        "delsumma", "subtotal", "summa exkl. moms", "summa exklusive moms",
-        "momsfri summa", "momsfritt belopp", "netto exkl. moms"
-    ]
+    row_lower = row.text_lower
     
     # Check in priority order (don't return early - need to continue scoring)
     keyword_found = False
-    for keyword in high_priority_keywords:
+    for keyword in _HIGH_PRIORITY_TOTAL_KEYWORDS:
         if keyword in row_lower:
             score += 0.32  # Reduced from 0.35
             keyword_found = True
             break
     
     if not keyword_found:
-        for keyword in medium_priority_keywords:
+        for keyword in _MEDIUM_PRIORITY_TOTAL_KEYWORDS:
             if keyword in row_lower:
                 score += 0.28  # Reduced from 0.30
                 keyword_found = True
                 break
     
     if not keyword_found:
-        for keyword in low_priority_keywords:
+        for keyword in _LOW_PRIORITY_TOTAL_KEYWORDS:
             if keyword in row_lower:
                 score += 0.18  # Reduced from 0.20
                 break
@@ -223,7 +225,7 @@ def score_total_amount_candidate(
             check_idx = row_index + offset
             if 0 <= check_idx < len(footer_rows):
                 check_row = footer_rows[check_idx]
-                check_row_lower = check_row.text.lower()
+                check_row_lower = check_row.text_lower
                 if any(keyword in check_row_lower for keyword in moms_keywords):
                     if abs(offset) <= 1:  # Within 1 row (2 rows total)
                         score += 0.05  # Full score
@@ -233,7 +235,7 @@ def score_total_amount_candidate(
     
     # Currency symbol signal (0.03 weight) - NEW
     currency_symbols = ['sek', 'kr', ':-', '€', '$']
-    row_lower = row.text.lower()
+    row_lower = row.text_lower
     if any(symbol in row_lower for symbol in currency_symbols):
         score += 0.03  # Currency symbol present
     
@@ -25,6 +25,16 @@ from ..pipeline.number_normalizer import normalize_swedish_decimal
 
 logger = logging.getLogger(__name__)
 
+# Amount pattern, compiled once and shared by all footer extractors.
+# Dot-thousands FIRST (require at least one .XXX) so "2.973,88" matches whole.
+# Then dot-decimal so "743.47" matches whole.
+_AMOUNT_PATTERN = re.compile(
+    r'\d{1,3}(?:\.\d{3})+(?:,\d{1,2})?|'      # Swedish dot thousands: "2.973,88", "3.717,35"
+    r'\d+\.\d{1,2}(?!\d)|'                     # Dot decimal only: "743.47", "8302.00"
+    r'\d{1,3}(?:\s+\d{3})*(?:[.,]\d{1,2})?|'  # Space thousands: "1 234,56"
+    r'\d+(?:,\d{1,2})?'                        # Comma decimal: "123,45"
+)
+
 # Cache for loaded calibration model (load once, reuse)
 _calibration_model_cache: Optional[CalibrationModel] = None
 _calibration_model_path: Optional[Path] = None
@@ -426,7 +436,7 @@ def extract_total_amount(
     keyword_type_above: Optional[str] = None
     if rows_above_footer:
         for r in reversed(rows_above_footer):
-            t = r.text.lower()
+            t = r.text_lower
             if any(re.search(p, t, re.IGNORECASE) for p in total_with_vat_patterns):
                 keyword_type_above = "with_vat"
                 break
@@ -437,16 +447,8 @@ def extract_total_amount(
                 keyword_type_above = "generic"
                 break
     
-    # Improved amount pattern. Dot-thousands FIRST (require at least one .XXX) so "2.973,88"
-    # matches whole. Then dot-decimal so "743.47" matches whole.
-    amount_pattern = re.compile(
-        r'\d{1,3}(?:\.\d{3})+(?:,\d{1,2})?|'      # Swedish dot thousands: "2.973,88", "3.717,35"
-        r'\d+\.\d{1,2}(?!\d)|'                     # Dot decimal only: "743.47", "8302.00"
-        r'\d{1,3}(?:\s+\d{3})*(?:[.,]\d{1,2})?|'  # Space thousands: "1 234,56"
-        r'\d+(?:,\d{1,2})?'                        # Comma decimal: "123,45"
-    )
     for row_index, row in enumerate(footer_segment.rows):
-        row_lower = row.text.lower()
+        row_lower = row.text_lower
         
         # Check if row contains total keywords and classify type
         has_keyword = False
@@ -467,12 +469,12 @@ def extract_total_amount(
         
         # Extract numeric amounts from row text (better than token-by-token for thousand separators)
         row_text = row.text
-        amount_matches = list(amount_pattern.finditer(row_text))
+        amount_matches = list(_AMOUNT_PATTERN.finditer(row_text))
         use_row, use_idx = row, row_index
         # If keyword row has no amount, check next row (e.g. "Nettobelopp" label, amount below)
         if has_keyword and not amount_matches and row_index + 1 < len(footer_segment.rows):
             next_row = footer_segment.rows[row_index + 1]
-            amount_matches = list(amount_pattern.finditer(next_row.text))
+            amount_matches = list(_AMOUNT_PATTERN.finditer(next_row.text))
             use_row, use_idx = next_row, row_index + 1
         
         # Use keyword from row above footer when first footer row has amounts only (labels in items)
@@ -531,7 +533,7 @@ def extract_total_amount(
         # Boost score based on keyword type (prioritize "with VAT" totals)
         keyword_type = candidate.get('keyword_type')
         if keyword_type == 'with_vat':
-            row_lower = candidate['row'].text.lower()
+            row_lower = candidate['row'].text_lower
             has_label = any(
                 k in row_lower for k in
                 ("att betala", "attbetala", "inkl. moms", "inklusive moms", "betalas", "slutsumma")
@@ -795,26 +797,18 @@ def extract_netto_total_from_footer(
         r"netto\s+exkl\.?\s*moms"
     ]
     
-    # Amount pattern (same as in extract_total_amount)
-    amount_pattern = re.compile(
-        r'\d{1,3}(?:\.\d{3})+(?:,\d{1,2})?|'
-        r'\d+\.\d{1,2}(?!\d)|'
-        r'\d{1,3}(?:\s+\d{3})*(?:[.,]\d{1,2})?|'
-        r'\d+(?:,\d{1,2})?'
-    )
-    
     # Check rows above footer for keyword type
     keyword_type_above: Optional[str] = None
     if rows_above_footer:
         for r in reversed(rows_above_footer):
-            t = r.text.lower()
+            t = r.text_lower
             if any(re.search(p, t, re.IGNORECASE) for p in total_without_vat_patterns):
                 keyword_type_above = "without_vat"
                 break
     
     # Search footer rows for "without_vat" amounts
     for row_index, row in enumerate(footer_segment.rows):
-        row_lower = row.text.lower()
+        row_lower = row.text_lower
         
         # Check if row contains "without VAT" keywords
         has_keyword = any(
@@ -824,13 +818,13 @@ def extract_netto_total_from_footer(
         
         # Extract amounts
         row_text = row.text
-        amount_matches = list(amount_pattern.finditer(row_text))
+        amount_matches = list(_AMOUNT_PATTERN.finditer(row_text))
         use_row = row
         
         # If keyword row has no amount, check next row
         if has_keyword and not amount_matches and row_index + 1 < len(footer_segment.rows):
             next_row = footer_segment.rows[row_index + 1]
-            amount_matches = list(amount_pattern.finditer(next_row.text))
+            amount_matches = list(_AMOUNT_PATTERN.finditer(next_row.text))
             use_row = next_row
         
         # Use keyword from row above footer if first footer row has amounts only
@@ -894,26 +888,18 @@ def extract_total_with_vat_from_footer(
         r"inkl\.?\s*moms",
     ]
     
-    # Amount pattern (same as in extract_total_amount)
-    amount_pattern = re.compile(
-        r'\d{1,3}(?:\.\d{3})+(?:,\d{1,2})?|'
-        r'\d+\.\d{1,2}(?!\d)|'
-        r'\d{1,3}(?:\s+\d{3})*(?:[.,]\d{1,2})?|'
-        r'\d+(?:,\d{1,2})?'
-    )
-    
     # Check rows above footer for keyword type
     keyword_type_above = None
     if rows_above_footer:
         for r in reversed(rows_above_footer):
-            t = r.text.lower()
+            t = r.text_lower
             if any(re.search(p, t, re.IGNORECASE) for p in total_with_vat_patterns):
                 keyword_type_above = "with_vat"
                 break
     
     # Search footer rows for "with_vat" amounts
     for row_index, row in enumerate(footer_segment.rows):
-        row_lower = row.text.lower()
+        row_lower = row.text_lower
         
         # Check if row contains "with VAT" keywords
         has_keyword = any(
@@ -923,13 +909,13 @@ def extract_total_with_vat_from_footer(
         
         # Extract amounts
         row_text = row.text
-        amount_matches = list(amount_pattern.finditer(row_text))
+        amount_matches = list(_AMOUNT_PATTERN.finditer(row_text))
         use_row = row
         
         # If keyword row has no amount, check next row
         if has_keyword and not amount_matches and row_index + 1 < len(footer_segment.rows):
             next_row = footer_segment.rows[row_index + 1]
-            amount_matches = list(amount_pattern.finditer(next_row.text))
+            amount_matches = list(_AMOUNT_PATTERN.finditer(next_row.text))
             use_row = next_row
         
         # Use keyword from row above footer if first footer row has amounts only
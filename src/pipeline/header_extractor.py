@@ -373,7 +373,7 @@ def _is_valid_invoice_number_candidate(candidate: str, row: Row, all_rows: List[
         return False
     
     # Filter out amounts (check if row contains currency symbols and amount-like patterns)
-    row_text = row.text.lower()
+    row_text = row.text_lower
     if any(symbol in row_text for symbol in ['kr', 'sek', ':-', '€', '$']):
         amount_pattern = re.compile(
             r'-?\d{1,3}(?:[ .]\d{3})*(?:[.,]\d{1,2})?-?|-?\d+(?:[.,]\d{1,2})?-?'
@@ -462,7 +462,7 @@ def extract_invoice_date(
     ]
     
     for row in header_segment.rows:
-        row_lower = row.text.lower()
+        row_lower = row.text_lower
         
         # Check if row contains date keywords
         has_keyword = any(keyword in row_lower for keyword in date_keywords)
@@ -553,7 +553,7 @@ def extract_vendor_name(
     candidates = []
     
     for row in header_segment.rows[:5]:  # Check first 5 rows (company name usually in top)
-        row_lower = row.text.lower()
+        row_lower = row.text_lower
         row_text = row.text.strip()
         
         # Skip rows with metadata keywords
@@ -14,6 +14,39 @@ from ..pipeline.row_grouping import group_tokens_to_rows
 from ..pipeline.segment_identification import identify_segments
 from ..pipeline.ocr_routing import evaluate_text_layer, get_ocr_routing_config
 
+# Patterns compiled once at import; boundary detection runs them per row per page.
+_HEADER_INVOICE_PATTERN = re.compile(
+    r'(?:fakturanummer|invoice\s*number|no\.|nr|number)[\s:]*([A-Z0-9\-]+)',
+    re.IGNORECASE
+)
+_FAKTURA_PATTERN = re.compile(r'faktura', re.IGNORECASE)
+_ALPHANUMERIC_PATTERN = re.compile(r'[A-Z0-9\-]{3,25}', re.IGNORECASE)
+_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}|\d{1,2}[./\-]\d{1,2}[./\-]\d{4}')
+_HEADER_AMOUNT_PATTERN = re.compile(r'\d+(?:[.,]\d{2})?(?:\s*(?:sek|kr|:-)?)', re.IGNORECASE)
+_FOOTER_AMOUNT_PATTERN = re.compile(r'\d+(?:[.,]\d{2})?\s*(?:sek|kr|:)?', re.IGNORECASE)
+_TOTAL_KEYWORDS = ("att betala", "totalt", "total", "summa att betala")
+
+_INVOICE_LABEL_PATTERNS = [
+    r"fakturanummer",
+    r"fakturanr",
+    r"faktura\s*nr",
+    r"fakt\.?\s*nr",
+    r"faktnr",
+    r"invoice\s*number",
+    r"invoice\s*no",
+    r"inv\s*no",
+    r"inv#",
+]
+_INVOICE_LABEL_RE = re.compile(r"(?:%s)" % "|".join(_INVOICE_LABEL_PATTERNS), re.IGNORECASE)
+_INVOICE_CANDIDATE_RE = re.compile(r"\b([A-Z0-9][A-Z0-9\-]{3,19})\b", re.IGNORECASE)
+_BOUNDARY_INVOICE_NUMBER_RE = re.compile(r"[A-Z0-9\-]+", re.IGNORECASE)
+
+_PAGE_LABEL_RE = re.compile(r"\b(?:sida|page)\s*(\d{1,3})\s*(?:/|av)\s*(\d{1,3})\b", re.IGNORECASE)
+_PAGE_FRACTION_RE = re.compile(r"\b(\d{1,3})\s*/\s*(\d{1,3})\b")
+
+# Per-page boundary signal: (invoice_candidate, page_number_info), None if page has no data
+_PageSignal = Optional[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]
+
 
 def _get_pdfplumber_text(
     page_number: int,
@@ -155,14 +188,51 @@ def _find_invoice_boundaries(
     
     Returns list of (page_start, page_end) tuples.
     """
+    signals = _classify_pages(doc, page_segments_map)
+    return _scan_boundaries(signals, verbose=verbose, decision_log=decision_log)
+
+
+def _classify_pages(
+    doc: Document,
+    page_segments_map: dict,
+) -> List[_PageSignal]:
+    """Extract per-page boundary signals (regex phase).
+    
+    Returns one entry per page in document order: None when the page has no
+    segments, otherwise (invoice_candidate, page_number_info).
+    """
+    signals: List[_PageSignal] = []
+    for page_num in range(1, len(doc.pages) + 1):
+        if page_num not in page_segments_map:
+            signals.append(None)
+            continue
+        segments, rows = page_segments_map[page_num]
+        page = doc.pages[page_num - 1]
+        header_segment = next((s for s in segments if s.segment_type == "header"), None)
+        signals.append((
+            _select_invoice_number_candidate(rows, page, header_segment),
+            _parse_page_number(rows),
+        ))
+    return signals
+
+
+def _scan_boundaries(
+    signals: List[_PageSignal],
+    verbose: bool = False,
+    decision_log: Optional[List[Dict[str, Any]]] = None,
+) -> List[Tuple[int, int]]:
+    """Turn per-page signals from _classify_pages into (page_start, page_end) boundaries.
+    
+    Pure state machine over invoice numbers and page numbering; no text access.
+    """
     boundaries: List[Tuple[int, int]] = []
     current_start = 1
     current_invoice_no: Optional[str] = None
     prev_page_number_info: Optional[Dict[str, Any]] = None
-    num_pages = len(doc.pages)
+    num_pages = len(signals)
     
-    for page_num in range(1, num_pages + 1):
-        if page_num not in page_segments_map:
+    for page_num, signal in enumerate(signals, start=1):
+        if signal is None:
             prev_page_number_info = None
             if decision_log is not None:
                 decision_log.append({
@@ -175,12 +245,7 @@ def _find_invoice_boundaries(
                 })
             continue
         
-        segments, rows = page_segments_map[page_num]
-        page = doc.pages[page_num - 1]
-        header_segment = next((s for s in segments if s.segment_type == "header"), None)
-        
-        invoice_candidate = _select_invoice_number_candidate(rows, page, header_segment)
-        page_number_info = _parse_page_number(rows)
+        invoice_candidate, page_number_info = signal
         
         decision = "continue"
         reasons: List[str] = []
@@ -254,14 +319,9 @@ def _has_strong_invoice_header(
         return False
     
     # Extract invoice number candidates using same logic as extract_invoice_number
-    invoice_pattern = re.compile(
-        r'(?:fakturanummer|invoice\s*number|no\.|nr|number)[\s:]*([A-Z0-9\-]+)',
-        re.IGNORECASE
-    )
-    
     candidates = []
     for row in header_segment.rows:
-        matches = invoice_pattern.findall(row.text)
+        matches = _HEADER_INVOICE_PATTERN.findall(row.text)
         for match in matches:
             if match:
                 candidates.append({
@@ -285,17 +345,13 @@ def _has_strong_invoice_header(
     # Fallback: "Faktura" + alphanumeric is NOT sufficient alone (15-DISCUSS D5).
     # Require additional signal: label match (we have candidates and score), strong candidate score (≥0.6),
     # or date/amount on same row.
-    faktura_pattern = re.compile(r'faktura', re.IGNORECASE)
-    alphanumeric_pattern = re.compile(r'[A-Z0-9\-]{3,25}', re.IGNORECASE)
-    date_pattern = re.compile(r'\d{4}-\d{2}-\d{2}|\d{1,2}[./\-]\d{1,2}[./\-]\d{4}')
-    amount_pattern = re.compile(r'\d+(?:[.,]\d{2})?(?:\s*(?:sek|kr|:-)?)', re.IGNORECASE)
     for row in header_segment.rows:
-        if not (faktura_pattern.search(row.text) and alphanumeric_pattern.search(row.text)):
+        if not (_FAKTURA_PATTERN.search(row.text) and _ALPHANUMERIC_PATTERN.search(row.text)):
             continue
         # Additional signal: strong candidate score (≥0.6) or date/amount on row
         if best_candidate_score >= 0.6:
             return True
-        if date_pattern.search(row.text) or amount_pattern.search(row.text):
+        if _DATE_PATTERN.search(row.text) or _HEADER_AMOUNT_PATTERN.search(row.text):
             return True
     
     return False
@@ -313,16 +369,12 @@ def _has_high_confidence_total(
     if not footer_segment or not footer_segment.rows:
         return False
     
-    # Check for total keywords
-    total_keywords = ["att betala", "totalt", "total", "summa att betala"]
-    
     for row in footer_segment.rows:
-        row_lower = row.text.lower()
-        for keyword in total_keywords:
+        row_lower = row.text_lower
+        for keyword in _TOTAL_KEYWORDS:
             if keyword in row_lower:
                 # Check for amount pattern (numbers with SEK/kr or decimal)
-                amount_pattern = re.compile(r'\d+(?:[.,]\d{2})?\s*(?:sek|kr|:)?', re.IGNORECASE)
-                if amount_pattern.search(row.text):
+                if _FOOTER_AMOUNT_PATTERN.search(row.text):
                     # Strong indication of total (simplified - full scoring requires line_items)
                     return True
     
@@ -338,35 +390,24 @@ def _select_invoice_number_candidate(
     if not rows:
         return None
     
-    label_patterns = [
-        r"fakturanummer",
-        r"fakturanr",
-        r"faktura\s*nr",
-        r"fakt\.?\s*nr",
-        r"faktnr",
-        r"invoice\s*number",
-        r"invoice\s*no",
-        r"inv\s*no",
-        r"inv#",
-    ]
-    label_re = re.compile(r"(?:%s)" % "|".join(label_patterns), re.IGNORECASE)
-    candidate_re = re.compile(r"\b([A-Z0-9][A-Z0-9\-]{3,19})\b", re.IGNORECASE)
+    label_re = _INVOICE_LABEL_RE
+    candidate_re = _INVOICE_CANDIDATE_RE
     
     candidates: List[Dict[str, Any]] = []
     # Use list instead of set since Row objects are not hashable
     header_rows = header_segment.rows if header_segment and header_segment.rows else []
     
     for idx, row in enumerate(rows):
-        if not label_re.search(row.text):
-            continue
+        # One label scan per row; the match end is reused for the candidate search
         row_text = row.text
         label_match = label_re.search(row_text)
+        if not label_match:
+            continue
         candidate = None
-        if label_match:
-            after = row_text[label_match.end():]
-            match = candidate_re.search(after)
-            if match:
-                candidate = match.group(1)
+        after = row_text[label_match.end():]
+        match = candidate_re.search(after)
+        if match:
+            candidate = match.group(1)
         
         if candidate is None:
             # If label-only row, check next row for candidate
@@ -408,7 +449,7 @@ def _validate_boundary_invoice_number(candidate: str) -> bool:
         return False
     if not (4 <= len(candidate) <= 20):
         return False
-    return bool(re.fullmatch(r"[A-Z0-9\-]+", candidate, re.IGNORECASE))
+    return bool(_BOUNDARY_INVOICE_NUMBER_RE.fullmatch(candidate))
 
 
 def _parse_page_number(rows: List[Row]) -> Optional[Dict[str, Any]]:
@@ -416,11 +457,8 @@ def _parse_page_number(rows: List[Row]) -> Optional[Dict[str, Any]]:
     if not rows:
         return None
     
-    label_re = re.compile(r"\b(?:sida|page)\s*(\d{1,3})\s*(?:/|av)\s*(\d{1,3})\b", re.IGNORECASE)
-    fraction_re = re.compile(r"\b(\d{1,3})\s*/\s*(\d{1,3})\b")
-    
     for row in rows:
-        m = label_re.search(row.text)
+        m = _PAGE_LABEL_RE.search(row.text)
         if m:
             current = int(m.group(1))
             total = int(m.group(2))
@@ -432,7 +470,7 @@ def _parse_page_number(rows: List[Row]) -> Optional[Dict[str, Any]]:
                     "source": "label",
                     "row_text": row.text
                 }
-        m = fraction_re.search(row.text)
+        m = _PAGE_FRACTION_RE.search(row.text)
         if m:
             current = int(m.group(1))
             total = int(m.group(2))
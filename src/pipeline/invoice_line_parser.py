@@ -2,6 +2,7 @@
 
 import re
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -51,6 +52,17 @@ _FOOTER_SOFT_KEYWORDS = frozenset([
     'lista', 'spec', 'bifogad', 'bifogadspec', 'hyraställning', 'hyraställningen',
     'fraktavgift', 'avgiftsbeskrivning', 'avgift',
 ])
+
+
+def _keyword_pattern(keywords) -> "re.Pattern[str]":
+    """Compile a substring alternation over lowercased keywords (one scan per row)."""
+    alternatives = sorted({k.lower() for k in keywords}, key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in alternatives))
+
+
+_FOOTER_HARD_PATTERN = _keyword_pattern(_FOOTER_HARD_KEYWORDS)
+_FOOTER_SOFT_PATTERN = _keyword_pattern(_FOOTER_SOFT_KEYWORDS)
+
 _AMOUNT_PATTERN = re.compile(
     r'-?\d{1,3}(?:[ .]\d{3})+(?:[.,]\d{1,2})?-?|-?\d+(?:[.,]\d{1,2})?-?'
 )
@@ -62,6 +74,41 @@ _TABLE_END_PATTERN = re.compile(r"nettobelopp\s+exkl\.?\s*moms", re.IGNORECASE)
 # See: .planning/phases/20-tabellsegment-kolumnregler/20-LIMITATIONS.md
 _MOMS_RATE_PATTERN = re.compile(r"\b25[.,]00\b")
 
+# Percentage discounts: "100,0%", "10,5%", "25%" (digits with optional decimal, followed by %)
+_PERCENTAGE_PATTERN = re.compile(
+    r'(\d{1,3}(?:[ .]\d{3})*(?:[.,]\d{1,2})?|\d+(?:[.,]\d{1,2})?)\s*%'
+)
+# Article numbers at start of description: "3838969", "2406CSX1P10.10", "10452L", "27 7615"
+_ARTICLE_NUMBER_PATTERN = re.compile(r'^([A-Z0-9]{4,}(?:\.[A-Z0-9]+)?|\d{1,2}\s+\d{5,8}|\d{6,12})\s+')
+# Quantity with thousand separators: "2 108", "1 260", "4 708", "1 085"
+_THOUSAND_SEP_QUANTITY_PATTERN = re.compile(r'\b(\d{1,3}(?:\s+\d{3})+)\b')
+
+# Token/description shapes used by the footer heuristics and field extraction
+_LEADING_NUMBER_PATTERN = re.compile(r'^\d+[.,]?\d*\s+')
+_LEADING_INT_PATTERN = re.compile(r'^\d+\s+')
+_LEADING_DIGITS_PATTERN = re.compile(r'^\d+')
+_NUMERIC_CHARS_PATTERN = re.compile(r'[\d\s,.-]')
+_NON_DIGIT_PATTERN = re.compile(r'[^0-9]')
+_DIGITS_PATTERN = re.compile(r'^\d+$')
+_PLAIN_NUMBER_PATTERN = re.compile(r'^\d+([.,]\d+)?$')
+_LINE_NUMBER_PATTERN = re.compile(r'^0?\d{1,3}$')
+_ALNUM_CODE_PREFIX_PATTERN = re.compile(r'^[A-Z0-9]{4,}')
+_LONG_DIGITS_PREFIX_PATTERN = re.compile(r'^\d{6,}')
+_ALNUM_CODE_PATTERN = re.compile(r'^[A-Z0-9]{4,}$')
+_LONG_DIGITS_PATTERN = re.compile(r'^\d{6,}$')
+_DOTTED_CODE_PATTERN = re.compile(r'^[A-Z0-9]{4,}(?:\.[A-Z0-9]+)?$')
+_LEADING_CODE_PATTERN = re.compile(r'^(\d+(?:\s+\d+)*|[A-Z0-9]{4,}(?:\.[A-Z0-9]+)?)')
+_UPPER_UNIT_PATTERN = re.compile(r'^[A-Z]{1,4}$')
+_METRIC_UNIT_PATTERN = re.compile(r'^[Mm][23]$')
+
+# Short numeric descriptions with large amounts that are really footer rows
+_SUSPICIOUS_FOOTER_PATTERN = re.compile(
+    r'^\d+\s+[a-zåäö]{1,15}\s+(enl|lista)'  # "4040 Maskiner enl Lista"
+    r'|lista\s+\d+'  # "Maskiner enl Lista 5"
+    r'|(hyraställning|hyraställningen).*bifogad.*spec'  # "Hyraställningenl.bifogadspec"
+    r'|^\d+\s+[a-zåäö]{1,10}\s*$'  # Very short: "4040 Maskiner" (no more words)
+)
+
 
 def _is_table_header_row(text_lower: str) -> bool:
     if "nettobelopp" not in text_lower:
@@ -76,7 +123,7 @@ def _get_table_block_rows(rows: List[Row]) -> Tuple[List[Row], bool]:
     for idx, row in enumerate(rows):
         if not row.text:
             continue
-        text_lower = row.text.lower()
+        text_lower = row.text_lower
         if start_idx is None and _is_table_header_row(text_lower):
             start_idx = idx + 1
             continue
@@ -91,8 +138,13 @@ def _get_table_block_rows(rows: List[Row]) -> Tuple[List[Row], bool]:
     return rows[start_idx:end_idx], True
 
 
+@lru_cache(maxsize=2048)
 def _parse_numeric_value(text: str) -> Optional[Decimal]:
-    """Parse numeric text via Swedish normalizer."""
+    """Parse numeric text via Swedish normalizer.
+    
+    Cached: amounts, prices and VAT rates repeat across rows and invoices,
+    and Decimal is immutable so parsed values can be shared.
+    """
     try:
         value = normalize_swedish_decimal(text)
     except ValueError:
@@ -136,16 +188,13 @@ def _is_footer_row(row: Row) -> bool:
     if not row.text:
         return False
     
-    text_lower = row.text.lower()
+    text_lower = row.text_lower
     
-    for keyword in _FOOTER_HARD_KEYWORDS:
-        if keyword.lower() in text_lower:
-            return True
+    if _FOOTER_HARD_PATTERN.search(text_lower):
+        return True
     
-    for keyword in _FOOTER_SOFT_KEYWORDS:
-        if keyword in text_lower:
-            if _row_has_total_like_amount(row):
-                return True
+    if _FOOTER_SOFT_PATTERN.search(text_lower) and _row_has_total_like_amount(row):
+        return True
     
     # Heuristics: short description + large amount, total-like patterns (unchanged)
     # Heuristic 1: Extract amount to check if it's suspiciously large
@@ -163,27 +212,20 @@ def _is_footer_row(row: Row) -> bool:
         # and description starts with numbers or contains only numbers + short text
         if len(description) < 50 and total_amount > 5000:
             # Check if description starts with numbers (e.g., "4040", "12,1")
-            if re.match(r'^\d+[.,]?\d*\s+', description) or re.match(r'^\d+\s+', description):
+            if _LEADING_NUMBER_PATTERN.match(description) or _LEADING_INT_PATTERN.match(description):
                 # Check if description is mostly numbers and short words
                 words = description.split()
                 if len(words) <= 5:  # Very short description
                     # Check if it contains suspicious patterns that indicate footer rows
                     # These patterns are more specific to avoid false positives
-                    suspicious_patterns = [
-                        r'^\d+\s+[a-zåäö]{1,15}\s+(enl|lista)',  # "4040 Maskiner enl Lista"
-                        r'lista\s+\d+',  # "Maskiner enl Lista 5"
-                        r'(hyraställning|hyraställningen).*bifogad.*spec',  # "Hyraställningenl.bifogadspec"
-                        r'^\d+\s+[a-zåäö]{1,10}\s*$',  # Very short: "4040 Maskiner" (no more words)
-                    ]
-                    for pattern in suspicious_patterns:
-                        if re.search(pattern, description_lower):
-                            return True
+                    if _SUSPICIOUS_FOOTER_PATTERN.search(description_lower):
+                        return True
                     
                     # Additional check: If description is extremely short (< 25 chars) 
                     # and starts with numbers, and amount is very large (> 10000)
                     if len(description) < 25 and total_amount > 10000:
                         # Check if it's mostly numbers with minimal text
-                        non_numeric = re.sub(r'[\d\s,.-]', '', description)
+                        non_numeric = _NUMERIC_CHARS_PATTERN.sub('', description)
                         if len(non_numeric) < 10:  # Very few non-numeric characters
                             return True
         
@@ -191,7 +233,7 @@ def _is_footer_row(row: Row) -> bool:
         # and amount is large (likely a total row)
         if len(description) < 30 and total_amount > 10000:
             # Check if description is mostly numbers
-            non_numeric_chars = re.sub(r'[\d\s,.-]', '', description)
+            non_numeric_chars = _NUMERIC_CHARS_PATTERN.sub('', description)
             if len(non_numeric_chars) < 15:  # Very few non-numeric characters
                 return True
     
@@ -233,10 +275,7 @@ def _extract_amount_from_row_text(
     amount_pattern = _AMOUNT_PATTERN
     
     # Pattern for percentage discounts: "100,0%", "10,5%", "25%", etc.
-    # Matches: digits with optional decimal, followed by %
-    percentage_pattern = re.compile(
-        r'(\d{1,3}(?:[ .]\d{3})*(?:[.,]\d{1,2})?|\d+(?:[.,]\d{1,2})?)\s*%'
-    )
+    percentage_pattern = _PERCENTAGE_PATTERN
     
     moms_match = None
     if require_moms:
@@ -257,9 +296,8 @@ def _extract_amount_from_row_text(
     # Process amount matches
     for match in amount_matches:
         amount_text = match.group(0)
-        try:
-            normalized = normalize_swedish_decimal(amount_text)
-        except ValueError:
+        normalized = _parse_numeric_value(amount_text)
+        if normalized is None:
             continue
         
         is_negative = normalized < 0
@@ -274,9 +312,8 @@ def _extract_amount_from_row_text(
         if not percent_text:
             continue
         
-        try:
-            percent_value = normalize_swedish_decimal(percent_text)
-        except ValueError:
+        percent_value = _parse_numeric_value(percent_text)
+        if percent_value is None:
             continue
         
         percent_value = abs(percent_value)
@@ -400,49 +437,8 @@ def _extract_amount_from_row_text(
     return (total_amount, discount, amount_token_idx)
 
 
-def extract_invoice_lines(
-    items_segment: Segment,
-    footer_segment: Optional[Segment] = None,
-    rows_above_footer: Optional[List[Row]] = None,
-    artifacts_dir: Optional[Path] = None,
-    invoice_id: Optional[str] = None
-) -> List[InvoiceLine]:
-    """Extract line items from items segment using layout-driven approach.
-    
-    Args:
-        items_segment: Segment object with segment_type='items'
-        footer_segment: Optional footer segment for validation (Phase 22)
-        rows_above_footer: Optional rows immediately above footer for validation
-        
-    Returns:
-        List of InvoiceLine objects
-        
-    Algorithm (layout-driven):
-    - Iterate through Segment.rows
-    - For each row, check if it contains a numeric amount (total_amount)
-    - Rule: "rad med belopp = produktrad" - if row contains amount, it's a product row
-    - Extract fields from row tokens using spatial information
-    
-    Phase 22: Validation-driven re-extraction (mode B):
-    - If table_parser_mode is "auto", validate after mode A extraction
-    - If validation fails, fallback to mode B (position-based)
-    - If table_parser_mode is "pos", use mode B directly
-    - If table_parser_mode is "text", use mode A only (no fallback)
-    """
-    if items_segment.segment_type != "items":
-        raise ValueError(
-            f"Segment must be of type 'items', got '{items_segment.segment_type}'"
-        )
-    
-    # Get table parser mode from config
-    parser_mode = get_table_parser_mode()
-    
-    # If mode is "pos", use mode B directly
-    if parser_mode == "pos":
-        logger.debug("Mode B (position-based) selected via config")
-        return extract_invoice_lines_mode_b(items_segment)
-    
-    # Extract with mode A (text-based)
+def _extract_lines_mode_a(items_segment: Segment) -> List[InvoiceLine]:
+    """Mode A (text-based) extraction: run the row loop over items_segment."""
     invoice_lines = []
     line_number = 1
     processed_row_indices = set()  # Track rows already processed as wraps
@@ -491,6 +487,54 @@ def extract_invoice_lines(
             invoice_lines.append(invoice_line)
             line_number += 1
     
+    return invoice_lines
+
+
+def extract_invoice_lines(
+    items_segment: Segment,
+    footer_segment: Optional[Segment] = None,
+    rows_above_footer: Optional[List[Row]] = None,
+    artifacts_dir: Optional[Path] = None,
+    invoice_id: Optional[str] = None
+) -> List[InvoiceLine]:
+    """Extract line items from items segment using layout-driven approach.
+    
+    Args:
+        items_segment: Segment object with segment_type='items'
+        footer_segment: Optional footer segment for validation (Phase 22)
+        rows_above_footer: Optional rows immediately above footer for validation
+        
+    Returns:
+        List of InvoiceLine objects
+        
+    Algorithm (layout-driven):
+    - Iterate through Segment.rows
+    - For each row, check if it contains a numeric amount (total_amount)
+    - Rule: "rad med belopp = produktrad" - if row contains amount, it's a product row
+    - Extract fields from row tokens using spatial information
+    
+    Phase 22: Validation-driven re-extraction (mode B):
+    - If table_parser_mode is "auto", validate after mode A extraction
+    - If validation fails, fallback to mode B (position-based)
+    - If table_parser_mode is "pos", use mode B directly
+    - If table_parser_mode is "text", use mode A only (no fallback)
+    """
+    if items_segment.segment_type != "items":
+        raise ValueError(
+            f"Segment must be of type 'items', got '{items_segment.segment_type}'"
+        )
+    
+    # Get table parser mode from config
+    parser_mode = get_table_parser_mode()
+    
+    # If mode is "pos", use mode B directly
+    if parser_mode == "pos":
+        logger.debug("Mode B (position-based) selected via config")
+        return extract_invoice_lines_mode_b(items_segment)
+    
+    # Extract with mode A (text-based)
+    invoice_lines = _extract_lines_mode_a(items_segment)
+    
     # Phase 22: Validation-driven re-extraction (mode B fallback)
     if parser_mode == "auto" and footer_segment is not None:
         # Extract "Nettobelopp exkl. moms" from footer
@@ -678,16 +722,16 @@ def _extract_line_from_row(
     for i, token in enumerate(description_tokens[:5]):  # Check first 5 tokens
         token_text = token.text.strip()
         # Skip if it's a simple line number (1-3 digits, possibly with leading zeros)
-        if re.match(r'^0?\d{1,3}$', token_text):
+        if _LINE_NUMBER_PATTERN.match(token_text):
             # Could be line number - check if next token is also numeric (likely article number)
             if i + 1 < len(description_tokens):
                 next_token = description_tokens[i + 1].text.strip()
                 # If next is alphanumeric or long number, first was line number
-                if re.match(r'^[A-Z0-9]{4,}', next_token) or re.match(r'^\d{6,}', next_token):
+                if _ALNUM_CODE_PREFIX_PATTERN.match(next_token) or _LONG_DIGITS_PREFIX_PATTERN.match(next_token):
                     description_start_idx = i + 1
                     break
         # Skip if it's an article number (alphanumeric code or 6+ digits)
-        elif re.match(r'^[A-Z0-9]{4,}$', token_text) or re.match(r'^\d{6,}$', token_text):
+        elif _ALNUM_CODE_PATTERN.match(token_text) or _LONG_DIGITS_PATTERN.match(token_text):
             description_start_idx = i + 1
             break
         # Skip position markers
@@ -744,13 +788,13 @@ def _extract_line_from_row(
             # Check if previous token is a number (quantity + unit pattern: "10 ST")
             if i > 0:
                 prev_token = tokens[i - 1].text.strip()
-                if re.match(r'^\d+$', prev_token):
+                if _DIGITS_PATTERN.match(prev_token):
                     potential_quantity = _parse_numeric_value(prev_token)
                     if potential_quantity is not None and 1 <= potential_quantity <= 100000:
                         quantity = potential_quantity
             break
         # Also check if token matches unit pattern (uppercase units like "ST", "EA", "M2", "BD")
-        elif re.match(r'^[A-Z]{1,4}$', token_text):
+        elif _UPPER_UNIT_PATTERN.match(token_text):
             token_lower_check = token_lower
             if token_lower_check in unit_keywords:
                 unit = token_lower_check
@@ -758,19 +802,19 @@ def _extract_line_from_row(
                 # Check if previous token is a number (quantity + unit pattern: "10 ST")
                 if i > 0:
                     prev_token = tokens[i - 1].text.strip()
-                    if re.match(r'^\d+$', prev_token):
+                    if _DIGITS_PATTERN.match(prev_token):
                         potential_quantity = _parse_numeric_value(prev_token)
                         if potential_quantity is not None and 1 <= potential_quantity <= 100000:
                             quantity = potential_quantity
                 break
         # Check for units with numbers (M2, M3)
-        elif re.match(r'^[Mm][23]$', token_text):
+        elif _METRIC_UNIT_PATTERN.match(token_text):
             unit = token_lower
             unit_token_idx = i
             # Check if previous token is a number
             if i > 0:
                 prev_token = tokens[i - 1].text.strip()
-                if re.match(r'^\d+$', prev_token):
+                if _DIGITS_PATTERN.match(prev_token):
                     potential_quantity = _parse_numeric_value(prev_token)
                     if potential_quantity is not None and 1 <= potential_quantity <= 100000:
                         quantity = potential_quantity
@@ -781,8 +825,7 @@ def _extract_line_from_row(
     # - Numeric: "3838969", "2406CSX1P10.10"
     # - Alphanumeric: "2406CSX1P10.10", "10452L"
     # - With spaces: "27 7615"
-    article_number_pattern = re.compile(r'^([A-Z0-9]{4,}(?:\.[A-Z0-9]+)?|\d{1,2}\s+\d{5,8}|\d{6,12})\s+')
-    has_article_number = bool(article_number_pattern.match(description))
+    has_article_number = bool(_ARTICLE_NUMBER_PATTERN.match(description))
     
     # Also check for article numbers that might be in separate column (before description)
     # Look at tokens before description_start_idx
@@ -791,18 +834,18 @@ def _extract_line_from_row(
         for token in article_tokens:
             token_text = token.text.strip()
             # Check if token looks like article number (alphanumeric 4+ chars or 6+ digits)
-            if re.match(r'^[A-Z0-9]{4,}(?:\.[A-Z0-9]+)?$', token_text) or re.match(r'^\d{6,}$', token_text):
+            if _DOTTED_CODE_PATTERN.match(token_text) or _LONG_DIGITS_PATTERN.match(token_text):
                 has_article_number = True
                 break
     
-    first_number_match = re.match(r'^(\d+(?:\s+\d+)*|[A-Z0-9]{4,}(?:\.[A-Z0-9]+)?)', description)
+    first_number_match = _LEADING_CODE_PATTERN.match(description)
     first_number_str = first_number_match.group(1) if first_number_match else ""
     first_number_cleaned = first_number_str.replace(' ', '').replace('.', '')
     first_number_value = None
-    if first_number_cleaned and (first_number_cleaned.isdigit() or re.match(r'^[A-Z0-9]{4,}$', first_number_cleaned)):
+    if first_number_cleaned and (first_number_cleaned.isdigit() or _ALNUM_CODE_PATTERN.match(first_number_cleaned)):
         try:
             # Try to extract numeric part if alphanumeric
-            numeric_part = re.sub(r'[^0-9]', '', first_number_cleaned)
+            numeric_part = _NON_DIGIT_PATTERN.sub('', first_number_cleaned)
             if numeric_part:
                 first_number_value = _parse_numeric_value(numeric_part)
         except ValueError:
@@ -824,8 +867,7 @@ def _extract_line_from_row(
         # Look for pattern: 1-3 digits, then space, then 3 digits (thousand separator format)
         # This pattern should be right before the unit
         # Try to find the last occurrence of this pattern before unit
-        thousand_sep_pattern = re.compile(r'\b(\d{1,3}(?:\s+\d{3})+)\b')
-        matches = list(thousand_sep_pattern.finditer(before_unit_text))
+        matches = list(_THOUSAND_SEP_QUANTITY_PATTERN.finditer(before_unit_text))
         
         if matches:
             # Take the last match (closest to unit) that's not an article number
@@ -876,7 +918,7 @@ def _extract_line_from_row(
                 token_text = token.text.strip()
                 
                 # Check if token is a pure number
-                if re.match(r'^\d+([.,]\d+)?$', token_text.replace(' ', '')):
+                if _PLAIN_NUMBER_PATTERN.match(token_text.replace(' ', '')):
                     numeric_value = _parse_numeric_value(token_text)
                     if numeric_value is None:
                         continue
@@ -891,7 +933,7 @@ def _extract_line_from_row(
                         elif i == 0 and numeric_value < 100 and numeric_value == int(numeric_value):
                             if len(tokens) > 1 and i + 1 < len(tokens):
                                 next_token = tokens[i + 1].text.strip()
-                                if re.match(r'^\d+', next_token):
+                                if _LEADING_DIGITS_PATTERN.match(next_token):
                                     is_article_or_line_number = True
                     
                     if not is_article_or_line_number:
@@ -925,7 +967,7 @@ def _extract_line_from_row(
                     for i in range(unit_token_idx + 1, amount_token_idx):
                         token = tokens[i]
                         token_text = token.text.strip()
-                        if re.match(r'^\d+([.,]\d+)?$', token_text.replace(' ', '')):
+                        if _PLAIN_NUMBER_PATTERN.match(token_text.replace(' ', '')):
                             numeric_value = _parse_numeric_value(token_text)
                             if numeric_value is not None and Decimal("0.01") <= numeric_value <= Decimal("1000000"):
                                 unit_price = numeric_value
@@ -941,7 +983,7 @@ def _extract_line_from_row(
             
             token_text = token.text.strip()
             # Check if token looks like a number
-            if re.match(r'^\d+([.,]\d+)?$', token_text.replace(' ', '')):
+            if _PLAIN_NUMBER_PATTERN.match(token_text.replace(' ', '')):
                 numeric_value = _parse_numeric_value(token_text)
                 if numeric_value is None:
                     continue
@@ -1040,7 +1082,7 @@ def extract_invoice_lines_mode_b(items_segment: Segment) -> List[InvoiceLine]:
     
     if not column_centers:
         logger.warning("Mode B: Column detection failed, falling back to mode A")
-        return extract_invoice_lines(items_segment)
+        return _extract_lines_mode_a(items_segment)
     
     # Step 2: Map columns to fields via header row (if available)
     column_map = None
@@ -1049,7 +1091,7 @@ def extract_invoice_lines_mode_b(items_segment: Segment) -> List[InvoiceLine]:
     
     # Find header row (first row with "nettobelopp" + column keywords)
     for idx, row in enumerate(table_rows):
-        if _is_table_header_row(row.text.lower()):
+        if _is_table_header_row(row.text_lower):
             header_row = row
             data_rows_start = idx + 1
             column_map = map_columns_from_header(header_row, column_centers)
@@ -1200,13 +1242,13 @@ def _extract_description_mode_b(
     # Skip leading numeric/article number tokens (same logic as mode A)
     for i, token in enumerate(description_tokens[:5]):
         token_text = token.text.strip()
-        if re.match(r'^0?\d{1,3}$', token_text):
+        if _LINE_NUMBER_PATTERN.match(token_text):
             if i + 1 < len(description_tokens):
                 next_token = description_tokens[i + 1].text.strip()
-                if re.match(r'^[A-Z0-9]{4,}', next_token) or re.match(r'^\d{6,}', next_token):
+                if _ALNUM_CODE_PREFIX_PATTERN.match(next_token) or _LONG_DIGITS_PREFIX_PATTERN.match(next_token):
                     description_start_idx = i + 1
                     break
-        elif re.match(r'^[A-Z0-9]{4,}$', token_text) or re.match(r'^\d{6,}$', token_text):
+        elif _ALNUM_CODE_PATTERN.match(token_text) or _LONG_DIGITS_PATTERN.match(token_text):
             description_start_idx = i + 1
             break
         elif token_text.lower() in ['pos', 'rad', 'obj']:
@@ -1228,9 +1270,9 @@ def _filter_description_tokens(tokens: List[Token]) -> str:
     for token in tokens:
         token_text = token.text.strip()
         # Skip line numbers, article numbers, position markers
-        if (re.match(r'^0?\d{1,3}$', token_text) or
-            re.match(r'^[A-Z0-9]{4,}$', token_text) or
-            re.match(r'^\d{6,}$', token_text) or
+        if (_LINE_NUMBER_PATTERN.match(token_text) or
+            _ALNUM_CODE_PATTERN.match(token_text) or
+            _LONG_DIGITS_PATTERN.match(token_text) or
             token_text.lower() in ['pos', 'rad', 'obj']):
             continue
         description_tokens.append(token)
@@ -1313,7 +1355,7 @@ def _extract_quantity_unit_price_mode_b(
             # Check if previous token is quantity
             if i > 0:
                 prev_token = tokens[i - 1].text.strip()
-                if re.match(r'^\d+$', prev_token):
+                if _DIGITS_PATTERN.match(prev_token):
                     potential_quantity = _parse_numeric_value(prev_token)
                     if potential_quantity is not None and 1 <= potential_quantity <= 100000:
                         quantity = potential_quantity
@@ -1328,7 +1370,7 @@ def _extract_quantity_unit_price_mode_b(
                     break
                 token = tokens[i]
                 token_text = token.text.strip()
-                if re.match(r'^\d+([.,]\d+)?$', token_text.replace(' ', '')):
+                if _PLAIN_NUMBER_PATTERN.match(token_text.replace(' ', '')):
                     numeric_value = _parse_numeric_value(token_text)
                     if numeric_value is not None and 1 <= numeric_value <= 100000:
                         quantity = numeric_value
@@ -1339,7 +1381,7 @@ def _extract_quantity_unit_price_mode_b(
             for i in range(unit_token_idx + 1, amount_token_idx):
                 token = tokens[i]
                 token_text = token.text.strip()
-                if re.match(r'^\d+([.,]\d+)?$', token_text.replace(' ', '')):
+                if _PLAIN_NUMBER_PATTERN.match(token_text.replace(' ', '')):
                     numeric_value = _parse_numeric_value(token_text)
                     if numeric_value is not None and Decimal("0.01") <= numeric_value <= Decimal("1000000"):
                         unit_price = numeric_value
@@ -7,6 +7,9 @@ import re
 _CURRENCY_PATTERN = re.compile(
     r"(?i)(?<=\d)\s*(?:sek|kr)\b\.?|\bsek\b|\bkr\b|:-|€|\$"
 )
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_DOT_THOUSANDS_PATTERN = re.compile(r"(?<=\d)\.(?=\d{3}(\D|$))")
+_DECIMAL_PATTERN = re.compile(r"\d+(\.\d+)?")
 
 
 def normalize_swedish_decimal(text: str) -> Decimal:
@@ -36,15 +39,15 @@ def normalize_swedish_decimal(text: str) -> Decimal:
         raw = raw[:-1].strip()
 
     cleaned = _CURRENCY_PATTERN.sub("", raw)
-    cleaned = re.sub(r"\s+", "", cleaned).strip()
+    cleaned = _WHITESPACE_PATTERN.sub("", cleaned).strip()
     if not cleaned:
         raise ValueError("Input text has no numeric content")
 
     # Remove dot thousand separators only when followed by three digits
-    cleaned = re.sub(r"(?<=\d)\.(?=\d{3}(\D|$))", "", cleaned)
+    cleaned = _DOT_THOUSANDS_PATTERN.sub("", cleaned)
     cleaned = cleaned.replace(",", ".")
 
-    if not re.fullmatch(r"\d+(\.\d+)?", cleaned):
+    if not _DECIMAL_PATTERN.fullmatch(cleaned):
         raise ValueError(f"Invalid numeric format: {text!r}")
 
     try:
@@ -233,11 +233,14 @@ def validate_netto_sum(
         Uses line.total_amount as netto (line items are exkl. moms per Phase 20).
         If line.total_amount is None, uses Decimal("0") for that line.
     """
-    # Calculate sum of line item net amounts
-    netto_sum = sum(
-        (_to_decimal(line.total_amount) or Decimal("0") for line in line_items),
-        Decimal("0")
-    )
+    # Calculate sum of line item net amounts; parsed lines already hold
+    # Decimal, so only other types go through _to_decimal
+    netto_sum = Decimal("0")
+    for line in line_items:
+        amount = line.total_amount
+        if not isinstance(amount, Decimal):
+            amount = _to_decimal(amount) or Decimal("0")
+        netto_sum += amount
     
     # Calculate difference
     diff = netto_total - netto_sum
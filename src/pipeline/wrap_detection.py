@@ -72,7 +72,7 @@ def _calculate_adaptive_y_threshold(rows: List[Row]) -> float:
         next_row = rows[i + 1]
         
         # Calculate y_max for current row (y + token height)
-        current_y_max = getattr(current_row, 'y_max', None)
+        current_y_max = current_row.y_max
         if current_y_max is None:
             current_y_max = current_row.y
             if current_row.tokens and hasattr(current_row.tokens[0], 'height'):
@@ -81,7 +81,7 @@ def _calculate_adaptive_y_threshold(rows: List[Row]) -> float:
                 current_y_max = current_row.y + 12  # Fallback: typical font height
         
         # Get next row's y_min or fallback to y
-        next_y_min = getattr(next_row, 'y_min', next_row.y)
+        next_y_min = next_row.y_min if next_row.y_min is not None else next_row.y
         
         # Y-distance between consecutive rows (gap between rows)
         y_distance = next_y_min - current_y_max
@@ -157,7 +157,7 @@ def detect_wrapped_rows(
         
         # Stop condition 2: Y-distance check (adaptive threshold)
         # Calculate y_max for prev_row (handle cases where y_min/y_max not set)
-        prev_y_max = getattr(prev_row, 'y_max', None)
+        prev_y_max = prev_row.y_max
         if prev_y_max is None:
             prev_y_max = prev_row.y
             if prev_row.tokens and hasattr(prev_row.tokens[0], 'height'):
@@ -165,7 +165,7 @@ def detect_wrapped_rows(
             else:
                 prev_y_max = prev_row.y + 12  # Fallback: typical font height
         
-        next_y_min = getattr(next_row, 'y_min', next_row.y)
+        next_y_min = next_row.y_min if next_row.y_min is not None else next_row.y
         
         y_distance = next_y_min - prev_y_max
         if y_distance > y_threshold:
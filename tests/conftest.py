@@ -0,0 +1,83 @@
+"""Shared pytest hooks and fixtures."""
+
+import os
+
+import pytest
+
+from src.models.document import Document
+from src.models.invoice_header import InvoiceHeader
+from src.models.page import Page
+from src.models.row import Row
+from src.models.segment import Segment
+from src.models.token import Token
+
+
+def pytest_configure(config):
+    """Use $PYTEST_BASETEMP as --basetemp when it is set and no flag was given.
+
+    Pointing it at a RAM-backed directory (e.g. /dev/shm/inv-parser-tests on
+    Linux CI) keeps tmp_path/tmp_path_factory scratch files off disk.
+    """
+    basetemp = os.environ.get("PYTEST_BASETEMP")
+    if basetemp and not config.option.basetemp:
+        config.option.basetemp = basetemp
+
+
+@pytest.fixture(scope="session")
+def blank_page():
+    """Single 612x792 Page on a one-page Document, shared read-only."""
+    doc = Document(filename="test.pdf", filepath="test.pdf", page_count=0, pages=[])
+    page = Page(page_number=1, width=612, height=792, document=doc)
+    doc.pages.append(page)
+    doc.page_count = 1
+    return page
+
+
+@pytest.fixture(scope="module")
+def sample_page():
+    """A4 (595x842) Page on a one-page Document, shared read-only per module.
+
+    Modules that need a different page still define their own sample_page.
+    """
+    doc = Document(
+        filename="test.pdf",
+        filepath="/path/to/test.pdf",
+        page_count=0,
+        pages=[],
+        metadata={}
+    )
+    
+    page = Page(
+        page_number=1,
+        document=doc,
+        width=595.0,
+        height=842.0,
+        tokens=[],
+        rendered_image_path=None
+    )
+    
+    doc.pages = [page]
+    return page
+
+
+@pytest.fixture(scope="module")
+def new_invoice_header(sample_page):
+    """Factory for a fresh InvoiceHeader on a one-row dummy header segment.
+
+    The dummy token/row/segment are built once per module and shared
+    read-only; each call returns a new InvoiceHeader.
+    """
+    dummy_token = Token(text="dummy", x=0, y=0, width=10, height=10, page=sample_page)
+    dummy_row = Row(tokens=[dummy_token], text="dummy", x_min=0, x_max=0, y=0, page=sample_page)
+    header_segment = Segment(
+        segment_type="header",
+        rows=[dummy_row],
+        y_min=0,
+        y_max=100,
+        page=sample_page
+    )
+
+    def _make():
+        return InvoiceHeader(segment=header_segment)
+
+    return _make
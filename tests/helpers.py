@@ -0,0 +1,38 @@
+"""Small helpers shared by test modules (not fixtures)."""
+
+import json
+
+from src.models.row import Row
+from src.models.token import Token
+
+try:
+    import orjson
+except ImportError:  # orjson is a dev extra; fall back to stdlib json
+    orjson = None
+
+
+def loads_json(data):
+    """Parse JSON bytes/str with orjson when available, else stdlib json."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def make_row(page, y, specs, height=12, text=None):
+    """Build a Row at y from (text, x, width) token specs.
+
+    x_min/x_max span the first and last token; text defaults to the
+    token texts joined by spaces.
+    """
+    tokens = [
+        Token(text=t, x=x, y=y, width=w, height=height, page=page)
+        for t, x, w in specs
+    ]
+    return Row(
+        tokens=tokens,
+        y=y,
+        x_min=specs[0][1],
+        x_max=specs[-1][1] + specs[-1][2],
+        text=text if text is not None else " ".join(t for t, _, _ in specs),
+        page=page
+    )
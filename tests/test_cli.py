@@ -123,9 +123,10 @@ def test_process_batch_excel_export_includes_validation(mock_process_pdf, temp_i
     excel_path = data.get("excel_path")
     assert excel_path and Path(excel_path).exists()
     import openpyxl
-    wb = openpyxl.load_workbook(excel_path)
+    wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
     ws = wb["Invoices"]
     headers = [c.value for c in ws[1]]
+    wb.close()
     assert "Status" in headers
     assert "Radsumma" in headers
     assert "Totalsumma-konfidens" in headers
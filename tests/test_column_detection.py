@@ -8,6 +8,7 @@ from src.models.document import Document
 from src.models.page import Page
 from src.models.row import Row
 from src.models.token import Token
+from src.pipeline import column_detection
 from src.pipeline.column_detection import (
     assign_tokens_to_columns,
     detect_columns_gap_based,
@@ -278,3 +279,24 @@ class TestTokenToColumnAssignment:
         # T3 and T4 should be in column 2 (closest to 300)
         assert len(column_tokens[0]) >= 1  # T1 or T2
         assert len(column_tokens[2]) >= 1  # T3 or T4
+    
+    def test_token_to_column_vectorized_matches_loop(self, sample_page, monkeypatch):
+        """Wide rows take the NumPy path; assignments match the per-token loop."""
+        # Wide and zero-width tokens, off-page tokens and a duplicated center
+        tokens = [
+            Token(text=f"T{i}", x=x, y=100, width=w, height=12, page=sample_page)
+            for i, (x, w) in enumerate([
+                (-30, 10), (40, 0), (60, 180), (150, 0), (199, 2), (250, 20),
+                (300, 0), (330, 120), (475, 0), (560, 40), (640, 10), (700, 0),
+            ])
+        ]
+        row = Row(tokens=tokens, text="wide", x_min=-30, x_max=700, y=100, page=sample_page)
+        column_centers = [500.0, 100.0, 200.0, 200.0, 300.0, 400.0, 580.0, 50.0, 250.0, 450.0]
+        
+        monkeypatch.setattr(column_detection, "_VECTORIZE_MIN_CELLS", 10**9)
+        expected = assign_tokens_to_columns(row, column_centers)
+        monkeypatch.setattr(column_detection, "_VECTORIZE_MIN_CELLS", 0)
+        actual = assign_tokens_to_columns(row, column_centers)
+        
+        assert {col: [t.text for t in toks] for col, toks in actual.items()} == \
+            {col: [t.text for t in toks] for col, toks in expected.items()}
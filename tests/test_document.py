@@ -1,5 +1,7 @@
 """Unit tests for Document model."""
 
+from dataclasses import replace
+
 import pytest
 from src.models.document import Document
 from src.models.page import Page
@@ -72,3 +74,23 @@ def test_document_page_count_mismatch_init():
             pages=[],
             metadata={}
         )
+
+
+def test_document_page_count_mismatch_replace():
+    """Test that replace() re-runs construction-time page count validation."""
+    doc = Document(
+        filename="test.pdf",
+        filepath="/path/to/test.pdf",
+        page_count=0,
+        pages=[],
+        metadata={}
+    )
+    page1 = Page(
+        page_number=1,
+        document=doc,
+        width=595.0,
+        height=842.0
+    )
+    
+    with pytest.raises(ValueError, match="Page count mismatch"):
+        replace(doc, pages=[page1])
@@ -1,5 +1,8 @@
 """Unit tests for Excel export."""
 
+import zipfile
+import xml.etree.ElementTree as ET
+
 import pytest
 import openpyxl
 from pathlib import Path
@@ -10,19 +13,66 @@ from src.models.row import Row
 from src.models.segment import Segment
 from src.export.excel_export import export_to_excel
 
-
-@pytest.fixture
-def sample_invoice_lines():
+_NS = {
+    "main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+_R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+
+def _read_header_row(path, sheet_name="Invoices"):
+    """Read the first row of a sheet straight from the xlsx ZIP.
+
+    Header-only checks do not need openpyxl's full workbook model, so this
+    resolves the sheet via workbook.xml and stops parsing at the first row.
+    Raises KeyError if the sheet does not exist.
+    """
+    with zipfile.ZipFile(path) as z:
+        workbook = ET.fromstring(z.read("xl/workbook.xml"))
+        rels = ET.fromstring(z.read("xl/_rels/workbook.xml.rels"))
+        sheet = workbook.find(f"main:sheets/main:sheet[@name='{sheet_name}']", _NS)
+        if sheet is None:
+            raise KeyError(sheet_name)
+        target = rels.find(f"rel:Relationship[@Id='{sheet.get(_R_ID)}']", _NS).get("Target")
+        sheet_xml = "xl/" + target.lstrip("/").removeprefix("xl/")
+
+        shared = []
+        if "xl/sharedStrings.xml" in z.namelist():
+            for si in ET.fromstring(z.read("xl/sharedStrings.xml")).iterfind("main:si", _NS):
+                shared.append("".join(t.text or "" for t in si.iter(f"{{{_NS['main']}}}t")))
+
+        with z.open(sheet_xml) as f:
+            for _, elem in ET.iterparse(f):
+                if elem.tag != f"{{{_NS['main']}}}row":
+                    continue
+                headers = []
+                for cell in elem.iterfind("main:c", _NS):
+                    if cell.get("t") == "inlineStr":
+                        headers.append("".join(t.text or "" for t in cell.iter(f"{{{_NS['main']}}}t")))
+                    elif cell.get("t") == "s":
+                        headers.append(shared[int(cell.findtext("main:v", namespaces=_NS))])
+                    else:
+                        headers.append(cell.findtext("main:v", namespaces=_NS))
+                return headers
+    return []
+
+
+STANDARD_META = {
+    "fakturanummer": "INV-001",
+    "foretag": "Test Company",
+    "fakturadatum": "2024-01-15",
+    "status": "OK",
+    "lines_sum": 100.0,
+    "diff": 0.0,
+    "invoice_number_confidence": 0.96,
+    "total_confidence": 0.97,
+}
+
+
+def _build_lines(page):
     """Create sample InvoiceLine objects for testing."""
-    from src.models.page import Page
-    from src.models.document import Document
     from src.models.token import Token
     
-    doc = Document(filename="test.pdf", filepath="test.pdf", page_count=0, pages=[])
-    page = Page(page_number=1, width=612, height=792, document=doc)
-    doc.pages.append(page)
-    doc.page_count = 1
-    
     # Create rows with tokens first
     token1 = Token(text="Product", x=0, y=100, width=60, height=12, page=page)
     token2 = Token(text="Service", x=0, y=120, width=60, height=12, page=page)
@@ -44,66 +94,54 @@ def sample_invoice_lines():
     ]
 
 
-def test_excel_export_with_control_columns(sample_invoice_lines, tmp_path):
+@pytest.fixture(scope="module")
+def sample_invoice_lines(blank_page):
+    """Create sample InvoiceLine objects for testing."""
+    return _build_lines(blank_page)
+
+
+@pytest.fixture(scope="session")
+def baseline_xlsx_bytes(tmp_path_factory, blank_page):
+    """Export the sample lines with STANDARD_META once per session."""
+    path = tmp_path_factory.mktemp("base") / "base.xlsx"
+    export_to_excel(_build_lines(blank_page), str(path), STANDARD_META)
+    return path.read_bytes()
+
+
+@pytest.fixture(scope="module")
+def exported_xlsx(tmp_path_factory, baseline_xlsx_bytes):
+    """Write the baseline export to a fresh path and return it."""
+    output_file = tmp_path_factory.mktemp("xlsx") / "test_invoices.xlsx"
+    output_file.write_bytes(baseline_xlsx_bytes)
+    return output_file
+
+
+@pytest.fixture(scope="module")
+def exported_ws(exported_xlsx):
+    """Yield the Invoices sheet of the shared export."""
+    wb = openpyxl.load_workbook(exported_xlsx, read_only=True, data_only=True)
+    yield wb['Invoices']
+    wb.close()
+
+
+def test_excel_export_with_control_columns(exported_xlsx):
     """Test Excel export includes control columns."""
-    output_file = tmp_path / "test_invoices.xlsx"
-    
-    metadata = {
-        "fakturanummer": "INV-001",
-        "foretag": "Test Company",
-        "fakturadatum": "2024-01-15",
-        "status": "OK",
-        "lines_sum": 100.0,
-        "diff": 0.0,
-        "invoice_number_confidence": 0.96,
-        "total_confidence": 0.97,
-    }
-    
-    export_to_excel(sample_invoice_lines, str(output_file), metadata)
-    
-    # Verify file was created
-    assert output_file.exists()
-    
-    # Read Excel file
-    wb = openpyxl.load_workbook(output_file)
-    ws = wb['Invoices']
-    
     # Verify control columns exist
-    headers = [cell.value for cell in ws[1]]
-    assert "Status" in headers
-    assert "Radsumma" in headers
-    assert "Avvikelse" in headers
-    assert "Fakturanummer-konfidens" in headers
-    assert "Totalsumma-konfidens" in headers
+    headers = _read_header_row(exported_xlsx, "Invoices")
+    control_cols = ["Status", "Radsumma", "Avvikelse", "Fakturanummer-konfidens", "Totalsumma-konfidens"]
+    assert set(control_cols) <= set(headers)
     
     # Verify column order: existing + Fakturatotal, then control columns
     existing_cols = ["Fakturanummer", "Referenser", "Företag", "Fakturadatum",
                      "Beskrivning", "Antal", "Enhet", "Á-pris", "Rabatt", "Summa", "Hela summan", "Fakturatotal"]
-    control_cols = ["Status", "Radsumma", "Avvikelse", "Fakturanummer-konfidens", "Totalsumma-konfidens"]
 
     assert headers[:len(existing_cols)] == existing_cols
     assert headers[len(existing_cols):] == control_cols
 
 
-def test_control_column_values(sample_invoice_lines, tmp_path):
+def test_control_column_values(exported_ws):
     """Test control column values match metadata."""
-    output_file = tmp_path / "test_invoices.xlsx"
-    
-    metadata = {
-        "fakturanummer": "INV-001",
-        "foretag": "Test Company",
-        "fakturadatum": "2024-01-15",
-        "status": "OK",
-        "lines_sum": 100.0,
-        "diff": 0.0,
-        "invoice_number_confidence": 0.96,
-        "total_confidence": 0.97,
-    }
-    
-    export_to_excel(sample_invoice_lines, str(output_file), metadata)
-    
-    wb = openpyxl.load_workbook(output_file)
-    ws = wb['Invoices']
+    ws = exported_ws
     
     # Check first data row (row 2, since row 1 is headers)
     row_data = [cell.value for cell in ws[2]]
@@ -117,44 +155,23 @@ def test_control_column_values(sample_invoice_lines, tmp_path):
     assert row_data[16] == 0.97  # Totalsumma-konfidens
 
 
-def test_control_columns_formatting(sample_invoice_lines, tmp_path):
+def test_control_columns_formatting(exported_ws):
     """Test control columns formatting (percentage for confidence, currency for amounts)."""
-    output_file = tmp_path / "test_invoices.xlsx"
+    ws = exported_ws
     
-    metadata = {
-        "fakturanummer": "INV-001",
-        "foretag": "Test Company",
-        "fakturadatum": "2024-01-15",
-        "status": "OK",
-        "lines_sum": 100.0,
-        "diff": 0.0,
-        "invoice_number_confidence": 0.96,
-        "total_confidence": 0.97,
-    }
-    
-    export_to_excel(sample_invoice_lines, str(output_file), metadata)
-    
-    wb = openpyxl.load_workbook(output_file)
-    ws = wb['Invoices']
-    
-    # Check formatting for data rows
-    for row_idx in range(2, ws.max_row + 1):
-        row = ws[row_idx]
-        
-        # Radsumma at index 13 (after Fakturatotal 11, Status 12)
-        radsumma_cell = row[13]
+    # Check formatting for data rows; only read Radsumma..Totalsumma-konfidens (columns 14–17)
+    rows = list(ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=14, max_col=17))
+    assert len(rows) == 2
+    for radsumma_cell, avvikelse_cell, fakturanummer_konfidens_cell, totalsumma_konfidens_cell in rows:
+        # Radsumma (index 13 after Fakturatotal 11, Status 12)
         assert radsumma_cell.number_format == "0.00"
 
-        # Avvikelse at index 14
-        avvikelse_cell = row[14]
+        # Avvikelse (index 14)
         if isinstance(avvikelse_cell.value, (int, float)):
             assert avvikelse_cell.number_format == "0.00"
 
-        # Confidence columns at 15, 16
-        fakturanummer_konfidens_cell = row[15]
+        # Confidence columns (indices 15, 16)
         assert fakturanummer_konfidens_cell.number_format == "0.00%"
-
-        totalsumma_konfidens_cell = row[16]
         assert totalsumma_konfidens_cell.number_format == "0.00%"
 
 
@@ -175,16 +192,18 @@ def test_diff_n_a_handling(sample_invoice_lines, tmp_path):
     
     export_to_excel(sample_invoice_lines, str(output_file), metadata)
     
-    wb = openpyxl.load_workbook(output_file)
+    wb = openpyxl.load_workbook(output_file, read_only=True, data_only=True)
     ws = wb['Invoices']
     
     # Check that diff shows "N/A"
-    row_data = [cell.value for cell in ws[2]]
+    row = ws[2]
+    wb.close()
+    row_data = [cell.value for cell in row]
     # Column order: ... Hela summan (10), Fakturatotal (11), Status (12), Radsumma (13), Avvikelse (14)
     assert row_data[14] == "N/A"  # Avvikelse
 
     # Verify "N/A" cell value is correct
-    avvikelse_cell = ws[2][14]  # Avvikelse
+    avvikelse_cell = row[14]  # Avvikelse
     assert avvikelse_cell.value == "N/A"
     # Cell should contain text "N/A", not a number
     assert isinstance(avvikelse_cell.value, str)
@@ -203,11 +222,12 @@ def test_backward_compatibility(sample_invoice_lines, tmp_path):
     
     export_to_excel(sample_invoice_lines, str(output_file), metadata)
     
-    wb = openpyxl.load_workbook(output_file)
+    wb = openpyxl.load_workbook(output_file, read_only=True, data_only=True)
     ws = wb['Invoices']
     
     # Verify control columns use defaults (indices 12–16 after Fakturatotal 11)
     row_data = [cell.value for cell in ws[2]]
+    wb.close()
     assert row_data[12] == "REVIEW"  # Status default
     assert row_data[13] == 0.0  # lines_sum default
     assert row_data[14] == "N/A"  # diff default
@@ -215,25 +235,9 @@ def test_backward_compatibility(sample_invoice_lines, tmp_path):
     assert row_data[16] == 0.0  # total_confidence default
 
 
-def test_control_columns_repeat_per_invoice(sample_invoice_lines, tmp_path):
+def test_control_columns_repeat_per_invoice(exported_ws):
     """Test that control columns repeat same value for all rows of same invoice."""
-    output_file = tmp_path / "test_invoices.xlsx"
-    
-    metadata = {
-        "fakturanummer": "INV-001",
-        "foretag": "Test Company",
-        "fakturadatum": "2024-01-15",
-        "status": "OK",
-        "lines_sum": 100.0,
-        "diff": 0.0,
-        "invoice_number_confidence": 0.96,
-        "total_confidence": 0.97,
-    }
-    
-    export_to_excel(sample_invoice_lines, str(output_file), metadata)
-    
-    wb = openpyxl.load_workbook(output_file)
-    ws = wb['Invoices']
+    ws = exported_ws
     
     # Verify all rows have same control column values (2 invoice lines); indices 12–16
     for row_idx in range(2, ws.max_row + 1):
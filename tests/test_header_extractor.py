@@ -2,8 +2,6 @@
 
 import pytest
 from datetime import date
-from src.models.document import Document
-from src.models.page import Page
 from src.models.row import Row
 from src.models.segment import Segment
 from src.models.token import Token
@@ -12,33 +10,12 @@ from src.pipeline.header_extractor import extract_invoice_number, extract_invoic
 from src.pipeline.confidence_scoring import score_invoice_number_candidate
 
 
-@pytest.fixture
-def sample_page():
-    """Create a sample Page for testing."""
-    doc = Document(
-        filename="test.pdf",
-        filepath="/path/to/test.pdf",
-        page_count=0,
-        pages=[],
-        metadata={}
-    )
-    
-    page = Page(
-        page_number=1,
-        document=doc,
-        width=595.0,
-        height=842.0,
-        tokens=[],
-        rendered_image_path=None
-    )
-    
-    doc.pages = [page]
-    return page
-
-
 @pytest.fixture
 def sample_header_segment(sample_page):
-    """Create a sample header segment with invoice number."""
+    """Create a sample header segment with invoice number.
+    
+    Function-scoped: several tests append/insert rows into segment.rows.
+    """
     # Header row with "Fakturanummer: 2024-001" (simplified to avoid prefix stripping issues in test)
     tokens = [
         Token(text="Fakturanummer", x=10, y=50, width=90, height=12, page=sample_page),
@@ -161,19 +138,10 @@ def test_extract_header_fields_all(sample_header_segment, sample_page):
     # invoice_date and supplier_name may be None (no hard gate)
 
 
-def test_no_header_segment_review(sample_page):
+def test_no_header_segment_review(new_invoice_header):
     """Test that missing header segment results in REVIEW for invoice number."""
-    # Create minimal InvoiceHeader without segment
-    dummy_token = Token(text="dummy", x=0, y=0, width=10, height=10, page=sample_page)
-    dummy_row = Row(tokens=[dummy_token], text="dummy", x_min=0, x_max=0, y=0, page=sample_page)
-    header_segment = Segment(
-        segment_type="header",
-        rows=[dummy_row],
-        y_min=0,
-        y_max=100,
-        page=sample_page
-    )
-    invoice_header = InvoiceHeader(segment=header_segment)
+    # Create minimal InvoiceHeader on a dummy segment
+    invoice_header = new_invoice_header()
     
     # No header segment (None)
     extract_invoice_number(None, invoice_header)
@@ -1,6 +1,8 @@
 """Tests for invoice boundary detection."""
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+import pytest
 
 from src.models.document import Document
 from src.models.page import Page
@@ -9,24 +11,23 @@ from src.models.segment import Segment
 from src.models.token import Token
 from src.pipeline.invoice_boundary_detection import _find_invoice_boundaries
 
+# Row texts shared by the page layouts below
+_INV_1001 = "Fakturanr: INV-1001"
+_INV_2001 = "Fakturanr: INV-2001"
+_ORDERNR = "Ordernr: 12345"
+_PAGE_1_OF_2 = "Sida 1/2"
+_PAGE_2_OF_2 = "Sida 2/2"
+
 
-def _make_rows(page: Page, row_specs: List[Tuple[str, float]]) -> List[Row]:
-    rows: List[Row] = []
-    for text, y in row_specs:
+def _make_rows(page: Page, row_specs: Sequence[Tuple[str, float]]) -> Tuple[Row, ...]:
+    def _row(text: str, y: float) -> Row:
         token = Token(text=text, x=10.0, y=y, width=200.0, height=12.0, page=page)
-        row = Row(
-            tokens=[token],
-            y=y,
-            x_min=token.x,
-            x_max=token.x + token.width,
-            text=text,
-            page=page,
-        )
-        rows.append(row)
-    return rows
+        return Row(tokens=[token], y=y, x_min=token.x, x_max=token.x + token.width, text=text, page=page)
 
+    return tuple(_row(text, y) for text, y in row_specs)
 
-def _make_page_segments(doc: Document, page_number: int, row_specs: List[Tuple[str, float]]):
+
+def _make_page_segments(doc: Document, page_number: int, row_specs: Sequence[Tuple[str, float]]):
     page = Page(
         page_number=page_number,
         document=doc,
@@ -37,21 +38,23 @@ def _make_page_segments(doc: Document, page_number: int, row_specs: List[Tuple[s
     )
     rows = _make_rows(page, row_specs)
     header_rows = [row for row in rows if row.y < 200]
-    segments: List[Segment] = []
+    segments: Tuple[Segment, ...] = ()
     if header_rows:
-        segments.append(
+        segments = (
             Segment(
                 segment_type="header",
                 rows=header_rows,
                 y_min=min(r.y for r in header_rows),
                 y_max=max(r.y for r in header_rows),
                 page=page,
-            )
+            ),
         )
     return page, rows, segments
 
 
-def _build_doc_with_pages(pages_data: List[List[Tuple[str, float]]]) -> Tuple[Document, Dict[int, Tuple[List[Segment], List[Row]]]]:
+def _build_doc_with_pages(
+    pages_data: Sequence[Sequence[Tuple[str, float]]],
+) -> Tuple[Document, Dict[int, Tuple[Tuple[Segment, ...], Tuple[Row, ...]]]]:
     doc = Document(
         filename="test.pdf",
         filepath="/path/to/test.pdf",
@@ -59,7 +62,7 @@ def _build_doc_with_pages(pages_data: List[List[Tuple[str, float]]]) -> Tuple[Do
         pages=[],
         metadata={},
     )
-    page_segments_map: Dict[int, Tuple[List[Segment], List[Row]]] = {}
+    page_segments_map: Dict[int, Tuple[Tuple[Segment, ...], Tuple[Row, ...]]] = {}
     pages: List[Page] = []
     for index, row_specs in enumerate(pages_data, start=1):
         page, rows, segments = _make_page_segments(doc, index, row_specs)
@@ -69,55 +72,53 @@ def _build_doc_with_pages(pages_data: List[List[Tuple[str, float]]]) -> Tuple[Do
     return doc, page_segments_map
 
 
-def test_two_invoices_two_pages_each():
-    doc, page_segments_map = _build_doc_with_pages(
-        [
-            [("Fakturanr: INV-1001", 60.0)],
-            [("Fakturanr: INV-1001", 60.0)],
-            [("Fakturanr: INV-2001", 60.0)],
-            [("Fakturanr: INV-2001", 60.0)],
-        ]
-    )
-
-    boundaries = _find_invoice_boundaries(doc, page_segments_map)
-
-    assert boundaries == [(1, 2), (3, 4)]
-
-
-def test_missing_invoice_number_uses_page_numbers():
-    doc, page_segments_map = _build_doc_with_pages(
-        [
-            [("Fakturanr: INV-1001", 60.0), ("Sida 1/2", 790.0)],
-            [("Sida 2/2", 790.0)],
-        ]
-    )
-
-    boundaries = _find_invoice_boundaries(doc, page_segments_map)
-
-    assert boundaries == [(1, 2)]
-
-
-def test_conflict_invoice_number_wins_over_page_number():
-    doc, page_segments_map = _build_doc_with_pages(
-        [
-            [("Fakturanr: INV-1001", 60.0), ("Sida 1/2", 790.0)],
-            [("Fakturanr: INV-2001", 60.0), ("Sida 2/2", 790.0)],
-        ]
-    )
-
-    boundaries = _find_invoice_boundaries(doc, page_segments_map)
-
-    assert boundaries == [(1, 1), (2, 2)]
-
-
-def test_ordernr_not_used_as_invoice_number():
-    doc, page_segments_map = _build_doc_with_pages(
-        [
-            [("Ordernr: 12345", 60.0), ("Sida 1/2", 790.0)],
-            [("Ordernr: 12345", 60.0), ("Sida 2/2", 790.0)],
-        ]
-    )
+_BOUNDARY_CASES = [
+    # A new invoice number starts a new invoice; a repeated one continues it
+    pytest.param(
+        (
+            ((_INV_1001, 60.0),),
+            ((_INV_1001, 60.0),),
+            ((_INV_2001, 60.0),),
+            ((_INV_2001, 60.0),),
+        ),
+        [(1, 2), (3, 4)],
+        id="two_invoices_two_pages_each",
+    ),
+    # Without an invoice number on page 2, "Sida 2/2" keeps it in the same invoice
+    pytest.param(
+        (
+            ((_INV_1001, 60.0), (_PAGE_1_OF_2, 790.0)),
+            ((_PAGE_2_OF_2, 790.0),),
+        ),
+        [(1, 2)],
+        id="missing_invoice_number_uses_page_numbers",
+    ),
+    # A changed invoice number wins over page numbering that says "continue"
+    pytest.param(
+        (
+            ((_INV_1001, 60.0), (_PAGE_1_OF_2, 790.0)),
+            ((_INV_2001, 60.0), (_PAGE_2_OF_2, 790.0)),
+        ),
+        [(1, 1), (2, 2)],
+        id="conflict_invoice_number_wins_over_page_number",
+    ),
+    # "Ordernr" is not an invoice number label; page numbering decides
+    pytest.param(
+        (
+            ((_ORDERNR, 60.0), (_PAGE_1_OF_2, 790.0)),
+            ((_ORDERNR, 60.0), (_PAGE_2_OF_2, 790.0)),
+        ),
+        [(1, 2)],
+        id="ordernr_not_used_as_invoice_number",
+    ),
+]
+
+
+@pytest.mark.parametrize("pages_data,expected", _BOUNDARY_CASES)
+def test_boundaries(pages_data, expected):
+    """Boundaries from invoice numbers and "Sida x/y" page numbering (one layout per case)."""
+    doc, page_segments_map = _build_doc_with_pages(pages_data)
 
     boundaries = _find_invoice_boundaries(doc, page_segments_map)
 
-    assert boundaries == [(1, 2)]
+    assert boundaries == expected
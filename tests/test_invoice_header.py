@@ -1,37 +1,39 @@
 """Unit tests for InvoiceHeader model."""
 
+import re
+
 import pytest
 from datetime import date
-from src.models.document import Document
-from src.models.page import Page
 from src.models.row import Row
 from src.models.segment import Segment
 from src.models.token import Token
 from src.models.traceability import Traceability
 from src.models.invoice_header import InvoiceHeader
 
+# Pure unit tests (fast); kept on one xdist worker so module fixtures are built once
+pytestmark = [pytest.mark.fast, pytest.mark.xdist_group("invoice_header")]
 
-@pytest.fixture
-def sample_segment():
-    """Create a sample header Segment for testing."""
-    doc = Document(
-        filename="test.pdf",
-        filepath="/path/to/test.pdf",
-        page_count=0,
-        pages=[],
-        metadata={}
-    )
-    
-    page = Page(
-        page_number=1,
-        document=doc,
-        width=595.0,
-        height=842.0,
-        tokens=[],
-        rendered_image_path=None
-    )
+_RANGE_INV = re.compile(r"invoice_number_confidence must be between")
+_RANGE_TOT = re.compile(r"total_confidence must be between")
+
+# Evidence for the header row in sample_segment; Traceability only reads it
+_SHARED_EVIDENCE = {
+    "page_number": 1,
+    "bbox": [100.0, 50.0, 90.0, 12.0],
+    "row_index": 0,
+    "text_excerpt": "Fakturanummer INV-001",
+    "tokens": [],
+}
+
+
+@pytest.fixture(scope="module")
+def sample_segment(sample_page):
+    """Create a sample header Segment for testing.
     
-    doc.pages = [page]
+    Built once per module on the shared sample_page; InvoiceHeader only
+    reads the segment, so tests share it read-only.
+    """
+    page = sample_page
     
     # Create header rows
     token1 = Token(text="Fakturanummer", x=10, y=50, width=80, height=12, page=page)
@@ -57,6 +59,19 @@ def sample_segment():
     return segment
 
 
+@pytest.fixture(scope="module")
+def make_traceability():
+    """Factory for invoice_no Traceability sharing _SHARED_EVIDENCE."""
+    def _make(value, confidence):
+        return Traceability(
+            field="invoice_no",
+            value=value,
+            confidence=confidence,
+            evidence=_SHARED_EVIDENCE,
+        )
+    return _make
+
+
 def test_invoice_header_creation(sample_segment):
     """Test InvoiceHeader creation with segment reference."""
     header = InvoiceHeader(segment=sample_segment)
@@ -84,22 +99,9 @@ def test_invoice_header_traceability_optional(sample_segment):
     assert header.total_traceability is None
 
 
-def test_invoice_header_with_extracted_fields(sample_segment):
+def test_invoice_header_with_extracted_fields(sample_segment, make_traceability):
     """Test InvoiceHeader with extracted invoice number and confidence."""
-    evidence = {
-        "page_number": 1,
-        "bbox": [100.0, 50.0, 90.0, 12.0],
-        "row_index": 0,
-        "text_excerpt": "Fakturanummer INV-001",
-        "tokens": []
-    }
-    
-    traceability = Traceability(
-        field="invoice_no",
-        value="INV-001",
-        confidence=0.98,
-        evidence=evidence
-    )
+    traceability = make_traceability("INV-001", 0.98)
     
     header = InvoiceHeader(
         segment=sample_segment,
@@ -113,58 +115,37 @@ def test_invoice_header_with_extracted_fields(sample_segment):
     assert header.invoice_number_traceability == traceability
 
 
-def test_invoice_header_meets_hard_gate(sample_segment):
+@pytest.mark.parametrize("inv_c,tot_c,expected", [
+    pytest.param(0.96, 0.97, True, id="both_meet_threshold"),
+    pytest.param(0.90, 0.97, False, id="invoice_number_below"),
+    pytest.param(0.97, 0.92, False, id="total_below"),
+    pytest.param(0.90, 0.92, False, id="both_below"),
+])
+def test_invoice_header_meets_hard_gate(sample_segment, inv_c, tot_c, expected):
     """Test hard gate evaluation (≥0.95 for both invoice number and total)."""
-    # Both meet threshold → OK
-    header1 = InvoiceHeader(
-        segment=sample_segment,
-        invoice_number_confidence=0.96,
-        total_confidence=0.97
-    )
-    assert header1.meets_hard_gate() is True
-    
-    # Invoice number below threshold → REVIEW
-    header2 = InvoiceHeader(
-        segment=sample_segment,
-        invoice_number_confidence=0.90,
-        total_confidence=0.97
-    )
-    assert header2.meets_hard_gate() is False
-    
-    # Total below threshold → REVIEW
-    header3 = InvoiceHeader(
-        segment=sample_segment,
-        invoice_number_confidence=0.97,
-        total_confidence=0.92
-    )
-    assert header3.meets_hard_gate() is False
-    
-    # Both below threshold → REVIEW
-    header4 = InvoiceHeader(
+    header = InvoiceHeader(
         segment=sample_segment,
-        invoice_number_confidence=0.90,
-        total_confidence=0.92
+        invoice_number_confidence=inv_c,
+        total_confidence=tot_c
     )
-    assert header4.meets_hard_gate() is False
+    assert header.meets_hard_gate() is expected
+
+
+def test_invoice_header_valid_confidence(sample_segment):
+    """Test that a confidence within 0.0-1.0 is accepted."""
+    header = InvoiceHeader(segment=sample_segment, invoice_number_confidence=0.5)
+    assert header.invoice_number_confidence == 0.5
 
 
-def test_invoice_header_confidence_range_validation(sample_segment):
+@pytest.mark.parametrize("field,value,pattern", [
+    pytest.param("invoice_number_confidence", 1.5, _RANGE_INV, id="invoice_number_above"),
+    pytest.param("invoice_number_confidence", -0.1, _RANGE_INV, id="invoice_number_below"),
+    pytest.param("total_confidence", 1.5, _RANGE_TOT, id="total_above"),
+])
+def test_invoice_header_confidence_range_validation(sample_segment, field, value, pattern):
     """Test that confidence scores must be between 0.0 and 1.0."""
-    # Valid confidence
-    header1 = InvoiceHeader(segment=sample_segment, invoice_number_confidence=0.5)
-    assert header1.invoice_number_confidence == 0.5
-    
-    # Invalid confidence (> 1.0)
-    with pytest.raises(ValueError, match="invoice_number_confidence must be between"):
-        InvoiceHeader(segment=sample_segment, invoice_number_confidence=1.5)
-    
-    # Invalid confidence (< 0.0)
-    with pytest.raises(ValueError, match="invoice_number_confidence must be between"):
-        InvoiceHeader(segment=sample_segment, invoice_number_confidence=-0.1)
-    
-    # Invalid total_confidence
-    with pytest.raises(ValueError, match="total_confidence must be between"):
-        InvoiceHeader(segment=sample_segment, total_confidence=1.5)
+    with pytest.raises(ValueError, match=pattern):
+        InvoiceHeader(segment=sample_segment, **{field: value})
 
 
 def test_invoice_header_date_normalization(sample_segment):
@@ -3,8 +3,6 @@
 from decimal import Decimal
 
 import pytest
-from src.models.document import Document
-from src.models.page import Page
 from src.models.row import Row
 from src.models.segment import Segment
 from src.models.token import Token
@@ -14,34 +12,16 @@ from src.pipeline.invoice_line_parser import (
     extract_invoice_lines_mode_b
 )
 
+from .helpers import make_row
 
-@pytest.fixture
-def sample_page():
-    """Create a sample Page for testing."""
-    doc = Document(
-        filename="test.pdf",
-        filepath="/path/to/test.pdf",
-        page_count=0,
-        pages=[],
-        metadata={}
-    )
-    
-    page = Page(
-        page_number=1,
-        document=doc,
-        width=595.0,
-        height=842.0,
-        tokens=[],
-        rendered_image_path=None
-    )
-    
-    doc.pages = [page]
-    return page
 
+# Pure unit tests (fast); kept on one xdist worker so module fixtures are built once
+pytestmark = [pytest.mark.fast, pytest.mark.xdist_group("invoice_lines")]
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_items_segment(sample_page):
-    """Create a sample items segment with product rows."""
+    """Create a sample items segment with product rows (shared read-only per module)."""
     # Row with product: description, quantity, unit_price, total_amount
     tokens_row1 = [
         Token(text="Product", x=10, y=300, width=60, height=12, page=sample_page),
@@ -101,124 +81,151 @@ def sample_items_segment(sample_page):
     return segment
 
 
-def test_extract_invoice_lines_from_items_segment(sample_items_segment):
-    """Test extraction from items segment."""
-    lines = extract_invoice_lines(sample_items_segment)
+@pytest.fixture(scope="module")
+def parsed_sample_lines(sample_items_segment):
+    """extract_invoice_lines(sample_items_segment), parsed once per module.
+
+    Returned as a tuple; tests must only read the shared lines.
+    """
+    return tuple(extract_invoice_lines(sample_items_segment))
+
+
+# (text, x, y, width, height) for the table_skeleton rows
+_HEADER_COORDS = (
+    ("Artikelnr", 10, 250, 60, 12),
+    ("Benämning", 90, 250, 70, 12),
+    ("Moms", 300, 250, 40, 12),
+    ("Nettobelopp", 360, 250, 80, 12),
+)
+_NETTO_FOOTER_COORDS = (
+    ("Nettobelopp", 50, 350, 90, 12),
+    ("exkl.", 145, 350, 40, 12),
+    ("moms:", 190, 350, 50, 12),
+    ("500.00", 550, 350, 60, 12),
+)
+
+
+def _tokens(page, coords):
+    """Build Tokens on page from (text, x, y, width, height) tuples."""
+    return [
+        Token(text=text, x=x, y=y, width=w, height=h, page=page)
+        for text, x, y, w, h in coords
+    ]
+
+
+@pytest.fixture(scope="module")
+def table_skeleton(sample_page):
+    """Header/footer rows shared by the table-block tests (read-only).
+
+    - "header": "Artikelnr Benämning Moms % Nettobelopp" table header at y=250
+    - "netto_footer": "Nettobelopp exkl. moms: 500.00" at y=350 (Mode B layout)
+    """
+    header_row = Row(
+        tokens=_tokens(sample_page, _HEADER_COORDS),
+        y=250,
+        x_min=10,
+        x_max=440,
+        text="Artikelnr Benämning Moms % Nettobelopp",
+        page=sample_page
+    )
     
-    # Should extract 2 line items (row3 has no amount, should be skipped)
-    assert len(lines) == 2
+    footer_row = Row(
+        tokens=_tokens(sample_page, _NETTO_FOOTER_COORDS),
+        y=350,
+        x_min=50,
+        x_max=610,
+        text="Nettobelopp exkl. moms: 500.00",
+        page=sample_page
+    )
+    
+    return {"header": header_row, "netto_footer": footer_row}
 
 
-def test_rad_med_belopp_rule(sample_items_segment):
-    """Test 'rad med belopp = produktrad' rule."""
-    lines = extract_invoice_lines(sample_items_segment)
+def test_items_segment_invariants(parsed_sample_lines):
+    """Test 'rad med belopp = produktrad': only rows with amounts become lines, numbered in order."""
+    lines = parsed_sample_lines
+    
+    # Should extract 2 line items (row3 has no amount, should be skipped)
+    assert len(lines) == 2
     
     # All extracted lines must have total_amount > 0
     assert all(line.total_amount > 0 for line in lines)
     
-    # Row without amount should not create InvoiceLine
-    assert len(lines) == 2  # Only rows with amounts
+    # Line numbers are assigned sequentially
+    assert [line.line_number for line in lines] == list(range(1, len(lines) + 1))
 
 
-def test_field_extraction(sample_items_segment):
+def test_field_extraction(parsed_sample_lines):
     """Test field extraction (description, quantity, unit_price, total_amount)."""
-    lines = extract_invoice_lines(sample_items_segment)
+    lines = parsed_sample_lines
     
     # First line should have quantity, unit, unit_price
     line1 = lines[0]
     # Note: Current implementation might keep quantity/price in description string if position based cleaning is conservative
     assert "Product" in line1.description
     assert line1.quantity == Decimal("2")
-    assert isinstance(line1.quantity, Decimal)
     assert line1.unit == "st"
     assert line1.unit_price == Decimal("150.00")
-    assert isinstance(line1.unit_price, Decimal)
     assert line1.total_amount == Decimal("300.00")
-    assert isinstance(line1.total_amount, Decimal)
     
     # Second line may not have quantity/unit_price
     line2 = lines[1]
     assert "Service" in line2.description
     assert line2.total_amount > 0
-    assert isinstance(line2.total_amount, Decimal)
 
 
-def test_amount_parsing_swedish_separators(sample_page):
-    """Ensure Swedish separators parse without dropping decimal dots."""
-    tokens_row1 = [
-        Token(text="Service", x=10, y=300, width=60, height=12, page=sample_page),
-        Token(text="9.345,67", x=300, y=300, width=80, height=12, page=sample_page),
+def test_decimal_types(parsed_sample_lines):
+    """Parsed numeric fields are Decimal (or None when absent)."""
+    for line in parsed_sample_lines:
+        for attr in ("quantity", "unit_price", "total_amount"):
+            value = getattr(line, attr)
+            assert value is None or isinstance(value, Decimal), (attr, value)
+
+
+def _amount_row_segment(page, amount_text):
+    """Single-row items segment: 'Service <amount_text>'."""
+    tokens = [
+        Token(text="Service", x=10, y=300, width=60, height=12, page=page),
+        Token(text=amount_text, x=300, y=300, width=80, height=12, page=page),
     ]
-    row1 = Row(
-        tokens=tokens_row1,
+    row = Row(
+        tokens=tokens,
         y=300,
         x_min=10,
         x_max=380,
-        text="Service 9.345,67",
-        page=sample_page
-    )
-    tokens_row2 = [
-        Token(text="Fee", x=10, y=330, width=40, height=12, page=sample_page),
-        Token(text="12.50", x=300, y=330, width=50, height=12, page=sample_page),
-    ]
-    row2 = Row(
-        tokens=tokens_row2,
-        y=330,
-        x_min=10,
-        x_max=350,
-        text="Fee 12.50",
-        page=sample_page
-    )
-    segment = Segment(
-        segment_type="items",
-        rows=[row1, row2],
-        y_min=300,
-        y_max=330,
-        page=sample_page
+        text=f"Service {amount_text}",
+        page=page
     )
+    return Segment(segment_type="items", rows=[row], y_min=300, y_max=300, page=page)
 
-    lines = extract_invoice_lines(segment)
 
-    assert len(lines) == 2
-    assert lines[0].total_amount == Decimal("9345.67")
-    assert lines[1].total_amount == Decimal("12.50")
+@pytest.mark.parametrize("amount_text,expected", [
+    ("9.345,67", Decimal("9345.67")),
+    ("12.50", Decimal("12.50")),
+    ("500,50", Decimal("500.50")),
+    ("1 187,50", Decimal("1187.50")),
+])
+def test_amount_parsing(sample_page, amount_text, expected):
+    """Ensure Swedish separators parse without dropping decimal dots."""
+    lines = extract_invoice_lines(_amount_row_segment(sample_page, amount_text))
+
+    assert len(lines) == 1
+    assert lines[0].total_amount == expected
     assert isinstance(lines[0].total_amount, Decimal)
-    assert isinstance(lines[1].total_amount, Decimal)
 
 
-def test_table_block_and_moms_column_rule(sample_page):
+def test_table_block_and_moms_column_rule(sample_page, table_skeleton):
     """Ensure table block filtering and moms% column rule are applied."""
-    header_tokens = [
-        Token(text="Artikelnr", x=10, y=250, width=60, height=12, page=sample_page),
-        Token(text="Benämning", x=90, y=250, width=70, height=12, page=sample_page),
-        Token(text="Moms", x=300, y=250, width=40, height=12, page=sample_page),
-        Token(text="Nettobelopp", x=360, y=250, width=80, height=12, page=sample_page),
-    ]
-    header_row = Row(
-        tokens=header_tokens,
-        y=250,
-        x_min=10,
-        x_max=440,
-        text="Artikelnr Benämning Moms % Nettobelopp",
-        page=sample_page
-    )
+    header_row = table_skeleton["header"]
 
-    row1_tokens = [
-        Token(text="A123", x=10, y=300, width=40, height=12, page=sample_page),
-        Token(text="Filter", x=60, y=300, width=50, height=12, page=sample_page),
-        Token(text="35.1", x=220, y=300, width=40, height=12, page=sample_page),
-        Token(text="38.9", x=260, y=300, width=40, height=12, page=sample_page),
-        Token(text="25.00", x=320, y=300, width=40, height=12, page=sample_page),
-        Token(text="1 187,50", x=380, y=300, width=60, height=12, page=sample_page),
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=10,
-        x_max=440,
-        text="A123 Filter 35.1 38.9 25.00 1 187,50",
-        page=sample_page
-    )
+    row1 = make_row(sample_page, 300, [
+        ("A123", 10, 40),
+        ("Filter", 60, 50),
+        ("35.1", 220, 40),
+        ("38.9", 260, 40),
+        ("25.00", 320, 40),
+        ("1 187,50", 380, 60),
+    ])
 
     continuation_tokens = [
         Token(text="LUFTRENARE", x=10, y=320, width=80, height=12, page=sample_page),
@@ -233,49 +240,25 @@ def test_table_block_and_moms_column_rule(sample_page):
         page=sample_page
     )
 
-    row2_tokens = [
-        Token(text="B234", x=10, y=340, width=40, height=12, page=sample_page),
-        Token(text="Service", x=60, y=340, width=60, height=12, page=sample_page),
-        Token(text="25,00", x=320, y=340, width=40, height=12, page=sample_page),
-        Token(text="250,00", x=380, y=340, width=60, height=12, page=sample_page),
-    ]
-    row2 = Row(
-        tokens=row2_tokens,
-        y=340,
-        x_min=10,
-        x_max=440,
-        text="B234 Service 25,00 250,00",
-        page=sample_page
-    )
+    row2 = make_row(sample_page, 340, [
+        ("B234", 10, 40),
+        ("Service", 60, 60),
+        ("25,00", 320, 40),
+        ("250,00", 380, 60),
+    ])
 
-    end_tokens = [
-        Token(text="Nettobelopp", x=10, y=400, width=90, height=12, page=sample_page),
-        Token(text="exkl.", x=105, y=400, width=40, height=12, page=sample_page),
-        Token(text="moms:", x=150, y=400, width=50, height=12, page=sample_page),
-        Token(text="1 437,50", x=380, y=400, width=60, height=12, page=sample_page),
-    ]
-    end_row = Row(
-        tokens=end_tokens,
-        y=400,
-        x_min=10,
-        x_max=440,
-        text="Nettobelopp exkl. moms: 1 437,50",
-        page=sample_page
-    )
+    end_row = make_row(sample_page, 400, [
+        ("Nettobelopp", 10, 90),
+        ("exkl.", 105, 40),
+        ("moms:", 150, 50),
+        ("1 437,50", 380, 60),
+    ])
 
-    footer_tokens = [
-        Token(text="Att", x=10, y=430, width=20, height=12, page=sample_page),
-        Token(text="betala", x=35, y=430, width=40, height=12, page=sample_page),
-        Token(text="1 796,88", x=380, y=430, width=60, height=12, page=sample_page),
-    ]
-    footer_row = Row(
-        tokens=footer_tokens,
-        y=430,
-        x_min=10,
-        x_max=440,
-        text="Att betala 1 796,88",
-        page=sample_page
-    )
+    footer_row = make_row(sample_page, 430, [
+        ("Att", 10, 20),
+        ("betala", 35, 40),
+        ("1 796,88", 380, 60),
+    ])
 
     segment = Segment(
         segment_type="items",
@@ -292,9 +275,9 @@ def test_table_block_and_moms_column_rule(sample_page):
     assert lines[1].total_amount == Decimal("250.00")
 
 
-def test_invoice_line_rows_traceability(sample_items_segment):
+def test_invoice_line_rows_traceability(parsed_sample_lines):
     """Test that InvoiceLine.rows maintains traceability."""
-    lines = extract_invoice_lines(sample_items_segment)
+    lines = parsed_sample_lines
     
     for line in lines:
         assert len(line.rows) > 0
@@ -303,26 +286,9 @@ def test_invoice_line_rows_traceability(sample_items_segment):
             assert len(row.tokens) > 0
 
 
-def test_line_numbers_assigned(sample_items_segment):
-    """Test that line numbers are assigned correctly."""
-    lines = extract_invoice_lines(sample_items_segment)
-    
-    for i, line in enumerate(lines, start=1):
-        assert line.line_number == i
-
-
-def test_rows_without_amounts_skipped(sample_items_segment):
-    """Test that rows without amounts are skipped."""
-    lines = extract_invoice_lines(sample_items_segment)
-    
-    # Should only have 2 lines (rows with amounts)
-    # Row 3 has no amount, should be skipped
-    assert len(lines) == 2
-
-
-def test_missing_fields_optional(sample_items_segment):
+def test_missing_fields_optional(parsed_sample_lines):
     """Test that missing fields (quantity/unit_price) are optional."""
-    lines = extract_invoice_lines(sample_items_segment)
+    lines = parsed_sample_lines
     
     # Find line without quantity/unit_price
     line_without_qty = next((l for l in lines if l.quantity is None), None)
@@ -335,36 +301,18 @@ def test_missing_fields_optional(sample_items_segment):
 
 def test_footer_rows_filtered(sample_page):
     """Test that footer rows (summa/total/att betala) are filtered out."""
-    from src.pipeline.invoice_line_parser import extract_invoice_lines
-    
     # Product row
-    product_tokens = [
-        Token(text="Product", x=10, y=300, width=60, height=12, page=sample_page),
-        Token(text="100.00", x=300, y=300, width=60, height=12, page=sample_page),
-    ]
-    product_row = Row(
-        tokens=product_tokens,
-        y=300,
-        x_min=10,
-        x_max=360,
-        text="Product 100.00",
-        page=sample_page
-    )
+    product_row = make_row(sample_page, 300, [
+        ("Product", 10, 60),
+        ("100.00", 300, 60),
+    ])
     
     # Footer row (should be filtered out)
-    footer_tokens = [
-        Token(text="Att", x=10, y=400, width=30, height=12, page=sample_page),
-        Token(text="betala", x=50, y=400, width=50, height=12, page=sample_page),
-        Token(text="1000.00", x=300, y=400, width=60, height=12, page=sample_page),
-    ]
-    footer_row = Row(
-        tokens=footer_tokens,
-        y=400,
-        x_min=10,
-        x_max=360,
-        text="Att betala 1000.00",
-        page=sample_page
-    )
+    footer_row = make_row(sample_page, 400, [
+        ("Att", 10, 30),
+        ("betala", 50, 50),
+        ("1000.00", 300, 60),
+    ])
     
     segment = Segment(
         segment_type="items",
@@ -386,61 +334,35 @@ def test_footer_rows_filtered(sample_page):
 # Phase 21 Regression Tests: Multi-line items (wrap detection)
 # ============================================================================
 
+def _wrap_row(page, y, text, tokens_spec):
+    """Build an amount-less continuation Row at y from (text, x, width) token specs."""
+    row = make_row(page, y, tokens_spec, text=text)
+    row.y_min = y
+    row.y_max = y + 12
+    return row
+
+
 def test_line_items_with_wrapped_descriptions(sample_page):
     """Test wrapped items extracted correctly with full description."""
     # Product row with amount
-    product_tokens = [
-        Token(text="Product", x=10, y=300, width=50, height=12, page=sample_page),
-        Token(text="description", x=70, y=300, width=80, height=12, page=sample_page),
-        Token(text="100.00", x=300, y=300, width=60, height=12, page=sample_page),
-    ]
-    product_row = Row(
-        tokens=product_tokens,
-        y=300,
-        x_min=10,
-        x_max=360,
-        text="Product description 100.00",
-        page=sample_page
-    )
+    product_row = make_row(sample_page, 300, [
+        ("Product", 10, 50),
+        ("description", 70, 80),
+        ("100.00", 300, 60),
+    ])
     product_row.y_min = 300
     product_row.y_max = 312
     
-    # Wrapped row 1 (no amount, close Y-distance)
-    wrap1_tokens = [
-        Token(text="Continuation", x=10, y=315, width=80, height=12, page=sample_page),
-        Token(text="line", x=95, y=315, width=30, height=12, page=sample_page),
+    # Wrapped rows (no amount, close Y-distance)
+    wrap_rows = [
+        _wrap_row(sample_page, 315, "Continuation line 1", (("Continuation", 10, 80), ("line", 95, 30))),
+        _wrap_row(sample_page, 330, "Continuation line 2",
+                  (("Continuation", 10, 80), ("line", 95, 30), ("2", 130, 10))),
     ]
-    wrap1_row = Row(
-        tokens=wrap1_tokens,
-        y=315,
-        x_min=10,
-        x_max=125,
-        text="Continuation line 1",
-        page=sample_page
-    )
-    wrap1_row.y_min = 315
-    wrap1_row.y_max = 327
-    
-    # Wrapped row 2 (no amount, close Y-distance)
-    wrap2_tokens = [
-        Token(text="Continuation", x=10, y=330, width=80, height=12, page=sample_page),
-        Token(text="line", x=95, y=330, width=30, height=12, page=sample_page),
-        Token(text="2", x=130, y=330, width=10, height=12, page=sample_page),
-    ]
-    wrap2_row = Row(
-        tokens=wrap2_tokens,
-        y=330,
-        x_min=10,
-        x_max=140,
-        text="Continuation line 2",
-        page=sample_page
-    )
-    wrap2_row.y_min = 330
-    wrap2_row.y_max = 342
     
     segment = Segment(
         segment_type="items",
-        rows=[product_row, wrap1_row, wrap2_row],
+        rows=[product_row, *wrap_rows],
         y_min=300,
         y_max=342,
         page=sample_page
@@ -516,34 +438,18 @@ def test_wrapped_items_with_start_patterns(sample_page):
 def test_no_false_wraps_from_footer(sample_page):
     """Test footer rows are not wrapped to items."""
     # Product row
-    product_tokens = [
-        Token(text="Product", x=10, y=300, width=50, height=12, page=sample_page),
-        Token(text="100.00", x=300, y=300, width=60, height=12, page=sample_page),
-    ]
-    product_row = Row(
-        tokens=product_tokens,
-        y=300,
-        x_min=10,
-        x_max=360,
-        text="Product 100.00",
-        page=sample_page
-    )
+    product_row = make_row(sample_page, 300, [
+        ("Product", 10, 50),
+        ("100.00", 300, 60),
+    ])
     product_row.y_min = 300
     product_row.y_max = 312
     
     # Footer row (close spacing, but should not be wrapped)
-    footer_tokens = [
-        Token(text="Summa", x=10, y=320, width=50, height=12, page=sample_page),
-        Token(text="100.00", x=300, y=320, width=60, height=12, page=sample_page),
-    ]
-    footer_row = Row(
-        tokens=footer_tokens,
-        y=320,
-        x_min=10,
-        x_max=360,
-        text="Summa 100.00",
-        page=sample_page
-    )
+    footer_row = make_row(sample_page, 320, [
+        ("Summa", 10, 50),
+        ("100.00", 300, 60),
+    ])
     footer_row.y_min = 320
     footer_row.y_max = 332
     
@@ -566,57 +472,28 @@ def test_no_false_wraps_from_footer(sample_page):
     assert len(lines[0].rows) == 1
 
 
-def test_phase_20_backward_compatibility(sample_page):
+def test_phase_20_backward_compatibility(sample_page, table_skeleton):
     """Test Phase 20 functionality still works with Phase 21 enhancements."""
     # Table header
-    header_tokens = [
-        Token(text="Artikelnr", x=10, y=250, width=60, height=12, page=sample_page),
-        Token(text="Benämning", x=90, y=250, width=70, height=12, page=sample_page),
-        Token(text="Moms", x=300, y=250, width=40, height=12, page=sample_page),
-        Token(text="Nettobelopp", x=360, y=250, width=80, height=12, page=sample_page),
-    ]
-    header_row = Row(
-        tokens=header_tokens,
-        y=250,
-        x_min=10,
-        x_max=440,
-        text="Artikelnr Benämning Moms % Nettobelopp",
-        page=sample_page
-    )
+    header_row = table_skeleton["header"]
     
     # Product row with VAT% (Phase 20 requirement)
-    row1_tokens = [
-        Token(text="A123", x=10, y=300, width=40, height=12, page=sample_page),
-        Token(text="Product", x=60, y=300, width=60, height=12, page=sample_page),
-        Token(text="25.00", x=320, y=300, width=40, height=12, page=sample_page),
-        Token(text="500.00", x=380, y=300, width=60, height=12, page=sample_page),
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=10,
-        x_max=440,
-        text="A123 Product 25.00 500.00",
-        page=sample_page
-    )
+    row1 = make_row(sample_page, 300, [
+        ("A123", 10, 40),
+        ("Product", 60, 60),
+        ("25.00", 320, 40),
+        ("500.00", 380, 60),
+    ])
     row1.y_min = 300
     row1.y_max = 312
     
     # Footer
-    end_tokens = [
-        Token(text="Nettobelopp", x=10, y=350, width=90, height=12, page=sample_page),
-        Token(text="exkl.", x=105, y=350, width=40, height=12, page=sample_page),
-        Token(text="moms:", x=150, y=350, width=50, height=12, page=sample_page),
-        Token(text="500.00", x=380, y=350, width=60, height=12, page=sample_page),
-    ]
-    end_row = Row(
-        tokens=end_tokens,
-        y=350,
-        x_min=10,
-        x_max=440,
-        text="Nettobelopp exkl. moms: 500.00",
-        page=sample_page
-    )
+    end_row = make_row(sample_page, 350, [
+        ("Nettobelopp", 10, 90),
+        ("exkl.", 105, 40),
+        ("moms:", 150, 50),
+        ("500.00", 380, 60),
+    ])
     
     segment = Segment(
         segment_type="items",
@@ -640,37 +517,21 @@ def test_phase_20_backward_compatibility(sample_page):
 def test_mode_b_position_based_parsing(sample_page):
     """Test Mode B extraction (full pipeline)."""
     # Create table with clear column gaps
-    header_tokens = [
-        Token(text="Benämning", x=50, y=250, width=200, height=12, page=sample_page),
-        Token(text="Antal", x=300, y=250, width=50, height=12, page=sample_page),
-        Token(text="Pris", x=450, y=250, width=50, height=12, page=sample_page),
-        Token(text="Nettobelopp", x=550, y=250, width=100, height=12, page=sample_page),
-    ]
-    header_row = Row(
-        tokens=header_tokens,
-        y=250,
-        x_min=50,
-        x_max=650,
-        text="Benämning Antal Pris Nettobelopp",
-        page=sample_page
-    )
+    header_row = make_row(sample_page, 250, [
+        ("Benämning", 50, 200),
+        ("Antal", 300, 50),
+        ("Pris", 450, 50),
+        ("Nettobelopp", 550, 100),
+    ])
     
     # Product row with clear column separation
-    row1_tokens = [
-        Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-        Token(text="5", x=300, y=300, width=20, height=12, page=sample_page),
-        Token(text="100.00", x=450, y=300, width=60, height=12, page=sample_page),
-        Token(text="25.00", x=520, y=300, width=40, height=12, page=sample_page),  # VAT%
-        Token(text="500.00", x=550, y=300, width=60, height=12, page=sample_page),  # Netto
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=50,
-        x_max=610,
-        text="Product 5 100.00 25.00 500.00",
-        page=sample_page
-    )
+    row1 = make_row(sample_page, 300, [
+        ("Product", 50, 200),
+        ("5", 300, 20),
+        ("100.00", 450, 60),
+        ("25.00", 520, 40),  # VAT%
+        ("500.00", 550, 60),  # Netto
+    ])
     
     segment = Segment(
         segment_type="items",
@@ -692,18 +553,10 @@ def test_mode_b_position_based_parsing(sample_page):
 def test_mode_b_fallback_to_mode_a(sample_page):
     """Test fallback to mode A when column detection fails."""
     # Create rows with no clear gaps (column detection should fail)
-    row1_tokens = [
-        Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-        Token(text="500.00", x=260, y=300, width=60, height=12, page=sample_page),  # No gap
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=50,
-        x_max=320,
-        text="Product 500.00",
-        page=sample_page
-    )
+    row1 = make_row(sample_page, 300, [
+        ("Product", 50, 200),
+        ("500.00", 260, 60),  # No gap
+    ])
     
     segment = Segment(
         segment_type="items",
@@ -722,39 +575,23 @@ def test_mode_b_fallback_to_mode_a(sample_page):
 def test_mode_b_hybrid_field_extraction(sample_page):
     """Test hybrid position+content approach in mode B."""
     # Create table with header for column mapping
-    header_tokens = [
-        Token(text="Benämning", x=50, y=250, width=200, height=12, page=sample_page),
-        Token(text="Antal", x=300, y=250, width=50, height=12, page=sample_page),
-        Token(text="Enhet", x=400, y=250, width=50, height=12, page=sample_page),
-        Token(text="Pris", x=500, y=250, width=50, height=12, page=sample_page),
-        Token(text="Nettobelopp", x=600, y=250, width=100, height=12, page=sample_page),
-    ]
-    header_row = Row(
-        tokens=header_tokens,
-        y=250,
-        x_min=50,
-        x_max=700,
-        text="Benämning Antal Enhet Pris Nettobelopp",
-        page=sample_page
-    )
+    header_row = make_row(sample_page, 250, [
+        ("Benämning", 50, 200),
+        ("Antal", 300, 50),
+        ("Enhet", 400, 50),
+        ("Pris", 500, 50),
+        ("Nettobelopp", 600, 100),
+    ])
     
     # Product row
-    row1_tokens = [
-        Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-        Token(text="5", x=300, y=300, width=20, height=12, page=sample_page),
-        Token(text="st", x=400, y=300, width=20, height=12, page=sample_page),
-        Token(text="100.00", x=500, y=300, width=60, height=12, page=sample_page),
-        Token(text="25.00", x=570, y=300, width=40, height=12, page=sample_page),  # VAT%
-        Token(text="500.00", x=600, y=300, width=60, height=12, page=sample_page),  # Netto
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=50,
-        x_max=660,
-        text="Product 5 st 100.00 25.00 500.00",
-        page=sample_page
-    )
+    row1 = make_row(sample_page, 300, [
+        ("Product", 50, 200),
+        ("5", 300, 20),
+        ("st", 400, 20),
+        ("100.00", 500, 60),
+        ("25.00", 570, 40),  # VAT%
+        ("500.00", 600, 60),  # Netto
+    ])
     
     segment = Segment(
         segment_type="items",
@@ -785,18 +622,10 @@ def test_text_mode_always_a(sample_page):
     from unittest.mock import patch
     
     # Create simple segment
-    row1_tokens = [
-        Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-        Token(text="500.00", x=300, y=300, width=60, height=12, page=sample_page),
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=50,
-        x_max=360,
-        text="Product 500.00",
-        page=sample_page
-    )
+    row1 = make_row(sample_page, 300, [
+        ("Product", 50, 200),
+        ("500.00", 300, 60),
+    ])
     
     segment = Segment(
         segment_type="items",
@@ -820,32 +649,16 @@ def test_pos_mode_always_b(sample_page):
     from unittest.mock import patch
     
     # Create table with clear column gaps
-    header_tokens = [
-        Token(text="Benämning", x=50, y=250, width=200, height=12, page=sample_page),
-        Token(text="Nettobelopp", x=550, y=250, width=100, height=12, page=sample_page),
-    ]
-    header_row = Row(
-        tokens=header_tokens,
-        y=250,
-        x_min=50,
-        x_max=650,
-        text="Benämning Nettobelopp",
-        page=sample_page
-    )
+    header_row = make_row(sample_page, 250, [
+        ("Benämning", 50, 200),
+        ("Nettobelopp", 550, 100),
+    ])
     
-    row1_tokens = [
-        Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-        Token(text="25.00", x=520, y=300, width=40, height=12, page=sample_page),  # VAT%
-        Token(text="500.00", x=550, y=300, width=60, height=12, page=sample_page),  # Netto
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=50,
-        x_max=610,
-        text="Product 25.00 500.00",
-        page=sample_page
-    )
+    row1 = make_row(sample_page, 300, [
+        ("Product", 50, 200),
+        ("25.00", 520, 40),  # VAT%
+        ("500.00", 550, 60),  # Netto
+    ])
     
     segment = Segment(
         segment_type="items",
@@ -865,269 +678,18 @@ def test_pos_mode_always_b(sample_page):
 
 
 # ============================================================================
-# Phase 22: Integration Tests
+# Phase 22: Table parser mode
 # ============================================================================
 
-def test_validation_driven_re_extraction(sample_page):
-    """Test full pipeline: Mode A extraction → validation fail → mode B → success."""
-    from unittest.mock import patch
-    from tempfile import TemporaryDirectory
-    from pathlib import Path
-    
-    # Create table with header for column mapping
-    header_tokens = [
-        Token(text="Benämning", x=50, y=250, width=200, height=12, page=sample_page),
-        Token(text="Nettobelopp", x=550, y=250, width=100, height=12, page=sample_page),
-    ]
-    header_row = Row(
-        tokens=header_tokens,
-        y=250,
-        x_min=50,
-        x_max=650,
-        text="Benämning Nettobelopp",
-        page=sample_page
-    )
-    
-    # Product row - Mode A will extract incorrectly (wrong amount)
-    row1_tokens = [
-        Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-        Token(text="25.00", x=520, y=300, width=40, height=12, page=sample_page),  # VAT% (could be mistaken for amount)
-        Token(text="500.00", x=550, y=300, width=60, height=12, page=sample_page),  # Actual netto
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=50,
-        x_max=610,
-        text="Product 25.00 500.00",
-        page=sample_page
-    )
-    
-    # Footer with netto total
-    footer_tokens = [
-        Token(text="Nettobelopp", x=50, y=350, width=90, height=12, page=sample_page),
-        Token(text="exkl.", x=145, y=350, width=40, height=12, page=sample_page),
-        Token(text="moms:", x=190, y=350, width=50, height=12, page=sample_page),
-        Token(text="500.00", x=550, y=350, width=60, height=12, page=sample_page),
-    ]
-    footer_row = Row(
-        tokens=footer_tokens,
-        y=350,
-        x_min=50,
-        x_max=610,
-        text="Nettobelopp exkl. moms: 500.00",
-        page=sample_page
-    )
-    
-    items_segment = Segment(
-        segment_type="items",
-        rows=[header_row, row1],
-        y_min=250,
-        y_max=350,
-        page=sample_page
-    )
-    
-    footer_segment = Segment(
-        segment_type="footer",
-        rows=[footer_row],
-        y_min=350,
-        y_max=400,
-        page=sample_page
-    )
-    
-    # Mock config to return "auto" mode (should trigger validation and fallback)
-    with patch('src.pipeline.invoice_line_parser.get_table_parser_mode', return_value='auto'):
-        with TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir)
-            invoice_id = "test_invoice_integration"
-            
-            lines = extract_invoice_lines(
-                items_segment,
-                footer_segment=footer_segment,
-                rows_above_footer=[row1],
-                artifacts_dir=artifacts_dir,
-                invoice_id=invoice_id
-            )
-            
-            # Should extract line item (mode B should succeed after mode A validation fails)
-            assert len(lines) >= 1
-            # Should extract correct amount (500.00)
-            assert any(line.total_amount == Decimal("500.00") for line in lines)
-
-
-def test_review_status_on_mismatch(sample_page):
-    """Test that status REVIEW is set when mismatch persists after mode B."""
-    from unittest.mock import patch
-    from tempfile import TemporaryDirectory
-    from pathlib import Path
-    
-    # Create table where both mode A and mode B will fail validation
-    row1_tokens = [
-        Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-        Token(text="600.00", x=550, y=300, width=60, height=12, page=sample_page),  # Wrong amount
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=50,
-        x_max=610,
-        text="Product 600.00",
-        page=sample_page
-    )
-    
-    # Footer with different netto total (mismatch)
-    footer_tokens = [
-        Token(text="Nettobelopp", x=50, y=350, width=90, height=12, page=sample_page),
-        Token(text="exkl.", x=145, y=350, width=40, height=12, page=sample_page),
-        Token(text="moms:", x=190, y=350, width=50, height=12, page=sample_page),
-        Token(text="500.00", x=550, y=350, width=60, height=12, page=sample_page),  # Different amount
-    ]
-    footer_row = Row(
-        tokens=footer_tokens,
-        y=350,
-        x_min=50,
-        x_max=610,
-        text="Nettobelopp exkl. moms: 500.00",
-        page=sample_page
-    )
-    
-    items_segment = Segment(
-        segment_type="items",
-        rows=[row1],
-        y_min=300,
-        y_max=350,
-        page=sample_page
-    )
-    
-    footer_segment = Segment(
-        segment_type="footer",
-        rows=[footer_row],
-        y_min=350,
-        y_max=400,
-        page=sample_page
-    )
-    
-    # Mock config to return "auto" mode
-    with patch('src.pipeline.invoice_line_parser.get_table_parser_mode', return_value='auto'):
-        with TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir)
-            invoice_id = "test_review_status"
-            
-            lines = extract_invoice_lines(
-                items_segment,
-                footer_segment=footer_segment,
-                rows_above_footer=[row1],
-                artifacts_dir=artifacts_dir,
-                invoice_id=invoice_id
-            )
-            
-            # Should still extract lines (even if validation fails)
-            assert len(lines) >= 0
-            
-            # Check that debug artifacts were saved (indicating REVIEW status)
-            debug_dir = artifacts_dir / "invoices" / invoice_id / "table_debug"
-            if debug_dir.exists():
-                # Debug artifacts should exist if validation failed
-                validation_result_path = debug_dir / "validation_result.json"
-                # Note: artifacts may not be saved if validation passes, so this is optional
-                # The important thing is that the function doesn't crash
-
-
-def test_debug_artifacts_integration(sample_page):
-    """Test that debug artifacts are saved correctly in integration."""
-    from unittest.mock import patch
-    from tempfile import TemporaryDirectory
-    from pathlib import Path
-    import json
-    
-    # Create table with mismatch
-    row1_tokens = [
-        Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-        Token(text="600.00", x=550, y=300, width=60, height=12, page=sample_page),
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=50,
-        x_max=610,
-        text="Product 600.00",
-        page=sample_page
-    )
-    
-    footer_tokens = [
-        Token(text="Nettobelopp", x=50, y=350, width=90, height=12, page=sample_page),
-        Token(text="exkl.", x=145, y=350, width=40, height=12, page=sample_page),
-        Token(text="moms:", x=190, y=350, width=50, height=12, page=sample_page),
-        Token(text="500.00", x=550, y=350, width=60, height=12, page=sample_page),
-    ]
-    footer_row = Row(
-        tokens=footer_tokens,
-        y=350,
-        x_min=50,
-        x_max=610,
-        text="Nettobelopp exkl. moms: 500.00",
-        page=sample_page
-    )
-    
-    items_segment = Segment(
-        segment_type="items",
-        rows=[row1],
-        y_min=300,
-        y_max=350,
-        page=sample_page
-    )
-    
-    footer_segment = Segment(
-        segment_type="footer",
-        rows=[footer_row],
-        y_min=350,
-        y_max=400,
-        page=sample_page
-    )
-    
-    with patch('src.pipeline.invoice_line_parser.get_table_parser_mode', return_value='auto'):
-        with TemporaryDirectory() as tmpdir:
-            artifacts_dir = Path(tmpdir)
-            invoice_id = "test_debug_integration"
-            
-            lines = extract_invoice_lines(
-                items_segment,
-                footer_segment=footer_segment,
-                rows_above_footer=[row1],
-                artifacts_dir=artifacts_dir,
-                invoice_id=invoice_id
-            )
-            
-            # Check if debug artifacts were created (only if validation failed)
-            debug_dir = artifacts_dir / "invoices" / invoice_id / "table_debug"
-            if debug_dir.exists():
-                # Verify all artifact files exist
-                raw_text_path = debug_dir / "table_block_raw_text.txt"
-                parsed_lines_path = debug_dir / "parsed_lines.json"
-                validation_result_path = debug_dir / "validation_result.json"
-                tokens_path = debug_dir / "table_block_tokens.json"
-                
-                # At least one should exist if validation failed
-                assert any(p.exists() for p in [raw_text_path, parsed_lines_path, validation_result_path, tokens_path])
-
-
 def test_config_table_parser_mode(sample_page):
     """Test that table_parser_mode configuration works correctly."""
     from unittest.mock import patch
     
     # Create simple segment
-    row1_tokens = [
-        Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-        Token(text="500.00", x=550, y=300, width=60, height=12, page=sample_page),
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=50,
-        x_max=610,
-        text="Product 500.00",
-        page=sample_page
-    )
+    row1 = make_row(sample_page, 300, [
+        ("Product", 50, 200),
+        ("500.00", 550, 60),
+    ])
     
     items_segment = Segment(
         segment_type="items",
@@ -1153,55 +715,26 @@ def test_config_table_parser_mode(sample_page):
         assert len(lines_auto) >= 0  # Should extract
 
 
-def test_phase_20_21_regression(sample_page):
+def test_phase_20_21_regression(sample_page, table_skeleton):
     """Regression test: Phase 20-21 functionality still works."""
     # Table header with VAT% column (Phase 20)
-    header_tokens = [
-        Token(text="Artikelnr", x=10, y=250, width=60, height=12, page=sample_page),
-        Token(text="Benämning", x=90, y=250, width=70, height=12, page=sample_page),
-        Token(text="Moms", x=300, y=250, width=40, height=12, page=sample_page),
-        Token(text="Nettobelopp", x=360, y=250, width=80, height=12, page=sample_page),
-    ]
-    header_row = Row(
-        tokens=header_tokens,
-        y=250,
-        x_min=10,
-        x_max=440,
-        text="Artikelnr Benämning Moms % Nettobelopp",
-        page=sample_page
-    )
+    header_row = table_skeleton["header"]
     
     # Product row with VAT% (Phase 20 requirement)
-    row1_tokens = [
-        Token(text="A123", x=10, y=300, width=40, height=12, page=sample_page),
-        Token(text="Product", x=60, y=300, width=60, height=12, page=sample_page),
-        Token(text="25.00", x=320, y=300, width=40, height=12, page=sample_page),  # VAT%
-        Token(text="500.00", x=380, y=300, width=60, height=12, page=sample_page),  # Netto
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=10,
-        x_max=440,
-        text="A123 Product 25.00 500.00",
-        page=sample_page
-    )
+    row1 = make_row(sample_page, 300, [
+        ("A123", 10, 40),
+        ("Product", 60, 60),
+        ("25.00", 320, 40),  # VAT%
+        ("500.00", 380, 60),  # Netto
+    ])
     row1.y_min = 300
     row1.y_max = 312
     
     # Wrapped description row (Phase 21)
-    row2_tokens = [
-        Token(text="Description", x=60, y=315, width=80, height=12, page=sample_page),
-        Token(text="continuation", x=60, y=315, width=100, height=12, page=sample_page),
-    ]
-    row2 = Row(
-        tokens=row2_tokens,
-        y=315,
-        x_min=60,
-        x_max=160,
-        text="Description continuation",
-        page=sample_page
-    )
+    row2 = make_row(sample_page, 315, [
+        ("Description", 60, 80),
+        ("continuation", 60, 100),
+    ])
     row2.y_min = 315
     row2.y_max = 327
     
@@ -1223,25 +756,15 @@ def test_phase_20_21_regression(sample_page):
     assert any("Product" in line.description or "Description" in line.description for line in lines)
 
 
-def test_val02_integration_mode_a(sample_page):
+def test_val02_integration_mode_a(sample_page, table_skeleton):
     """Test VAL-02 integration: Mode A validates total with VAT."""
     from unittest.mock import patch
-    from tempfile import TemporaryDirectory
-    from pathlib import Path
     
     # Create table with items
-    row1_tokens = [
-        Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-        Token(text="500.00", x=550, y=300, width=60, height=12, page=sample_page),
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=50,
-        x_max=610,
-        text="Product 500.00",
-        page=sample_page
-    )
+    row1 = make_row(sample_page, 300, [
+        ("Product", 50, 200),
+        ("500.00", 550, 60),
+    ])
     
     items_segment = Segment(
         segment_type="items",
@@ -1252,20 +775,7 @@ def test_val02_integration_mode_a(sample_page):
     )
     
     # Footer with netto and "Att betala"
-    footer_tokens_netto = [
-        Token(text="Nettobelopp", x=50, y=350, width=90, height=12, page=sample_page),
-        Token(text="exkl.", x=145, y=350, width=40, height=12, page=sample_page),
-        Token(text="moms:", x=190, y=350, width=50, height=12, page=sample_page),
-        Token(text="500.00", x=550, y=350, width=60, height=12, page=sample_page),
-    ]
-    footer_row_netto = Row(
-        tokens=footer_tokens_netto,
-        y=350,
-        x_min=50,
-        x_max=610,
-        text="Nettobelopp exkl. moms: 500.00",
-        page=sample_page
-    )
+    footer_row_netto = table_skeleton["netto_footer"]
     
     footer_tokens_vat = [
         Token(text="Att", x=50, y=370, width=30, height=12, page=sample_page),
@@ -1302,38 +812,22 @@ def test_val02_integration_mode_a(sample_page):
         # VAL-01 and VAL-02 should both pass (500.00 netto, 625.00 total with VAT)
 
 
-def test_val02_triggers_mode_b_fallback(sample_page):
+def test_val02_triggers_mode_b_fallback(sample_page, table_skeleton):
     """Test VAL-02 failure triggers mode B fallback."""
     from unittest.mock import patch
     
     # Create table with clear column gaps for mode B
-    header_tokens = [
-        Token(text="Benämning", x=50, y=250, width=200, height=12, page=sample_page),
-        Token(text="Nettobelopp", x=550, y=250, width=100, height=12, page=sample_page),
-    ]
-    header_row = Row(
-        tokens=header_tokens,
-        y=250,
-        x_min=50,
-        x_max=650,
-        text="Benämning Nettobelopp",
-        page=sample_page
-    )
+    header_row = make_row(sample_page, 250, [
+        ("Benämning", 50, 200),
+        ("Nettobelopp", 550, 100),
+    ])
     
     # Product row with clear column separation
-    row1_tokens = [
-        Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-        Token(text="25.00", x=520, y=300, width=40, height=12, page=sample_page),  # VAT%
-        Token(text="500.00", x=550, y=300, width=60, height=12, page=sample_page),  # Netto
-    ]
-    row1 = Row(
-        tokens=row1_tokens,
-        y=300,
-        x_min=50,
-        x_max=610,
-        text="Product 25.00 500.00",
-        page=sample_page
-    )
+    row1 = make_row(sample_page, 300, [
+        ("Product", 50, 200),
+        ("25.00", 520, 40),  # VAT%
+        ("500.00", 550, 60),  # Netto
+    ])
     
     items_segment = Segment(
         segment_type="items",
@@ -1344,20 +838,7 @@ def test_val02_triggers_mode_b_fallback(sample_page):
     )
     
     # Footer with correct netto but wrong "Att betala" (triggers VAL-02 failure)
-    footer_tokens_netto = [
-        Token(text="Nettobelopp", x=50, y=350, width=90, height=12, page=sample_page),
-        Token(text="exkl.", x=145, y=350, width=40, height=12, page=sample_page),
-        Token(text="moms:", x=190, y=350, width=50, height=12, page=sample_page),
-        Token(text="500.00", x=550, y=350, width=60, height=12, page=sample_page),  # Correct netto
-    ]
-    footer_row_netto = Row(
-        tokens=footer_tokens_netto,
-        y=350,
-        x_min=50,
-        x_max=610,
-        text="Nettobelopp exkl. moms: 500.00",
-        page=sample_page
-    )
+    footer_row_netto = table_skeleton["netto_footer"]
     
     footer_tokens_vat = [
         Token(text="Att", x=50, y=370, width=30, height=12, page=sample_page),
@@ -5,8 +5,6 @@ from decimal import Decimal
 
 import pytest
 
-from src.models.document import Document
-from src.models.page import Page
 from src.models.row import Row
 from src.models.segment import Segment
 from src.models.token import Token
@@ -17,28 +15,57 @@ from src.pipeline.column_detection import (
 from src.pipeline.invoice_line_parser import extract_invoice_lines_mode_b
 from src.pipeline.validation import validate_netto_sum
 
+try:
+    import pytest_benchmark
+except ImportError:
+    pytest_benchmark = None
 
-@pytest.fixture
-def sample_page():
-    """Create a sample page for testing."""
-    doc = Document(filename="test.pdf", filepath="test.pdf", page_count=0, pages=[])
-    page = Page(page_number=1, width=612, height=792, document=doc)
-    doc.pages.append(page)
-    doc.page_count = 1
-    return page
 
+if pytest_benchmark is None:
+    class _SingleRun:
+        """Stand-in for the pytest-benchmark fixture: runs once, collects no stats."""
 
-@pytest.fixture
-def large_table(sample_page):
-    """Create a large table with 50 rows for performance testing."""
+        enabled = False
+
+        def __init__(self):
+            self.extra_info = {}
+
+        def __call__(self, func, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        def pedantic(self, func, args=(), kwargs=None, **options):
+            return func(*args, **(kwargs or {}))
+
+    @pytest.fixture
+    def benchmark():
+        """Fallback when pytest-benchmark (dev extra) is not installed."""
+        return _SingleRun()
+
+
+def _assert_mean_below(benchmark, target_ms, what):
+    """Assert the benchmarked mean is under target_ms.
+    
+    Skipped when benchmarking is disabled (--benchmark-disable, under xdist
+    or without pytest-benchmark), where the function only runs once and no
+    stats are collected.
+    """
+    if not benchmark.enabled:
+        return
+    mean_ms = benchmark.stats.stats.mean * 1000
+    assert mean_ms < target_ms, f"{what} took {mean_ms:.3f}ms (target: <{target_ms:g}ms)"
+
+
+@pytest.fixture(scope="module")
+def large_table(blank_page):
+    """Create a large table with 50 rows for performance testing (read-only tuple)."""
     rows = []
     
     # Header row
     header_tokens = [
-        Token(text="Benämning", x=50, y=250, width=200, height=12, page=sample_page),
-        Token(text="Antal", x=300, y=250, width=50, height=12, page=sample_page),
-        Token(text="Pris", x=450, y=250, width=50, height=12, page=sample_page),
-        Token(text="Nettobelopp", x=550, y=250, width=100, height=12, page=sample_page),
+        Token(text="Benämning", x=50, y=250, width=200, height=12, page=blank_page),
+        Token(text="Antal", x=300, y=250, width=50, height=12, page=blank_page),
+        Token(text="Pris", x=450, y=250, width=50, height=12, page=blank_page),
+        Token(text="Nettobelopp", x=550, y=250, width=100, height=12, page=blank_page),
     ]
     header_row = Row(
         tokens=header_tokens,
@@ -46,7 +73,7 @@ def large_table(sample_page):
         x_min=50,
         x_max=650,
         text="Benämning Antal Pris Nettobelopp",
-        page=sample_page
+        page=blank_page
     )
     rows.append(header_row)
     
@@ -54,11 +81,11 @@ def large_table(sample_page):
     for i in range(50):
         y_pos = 280 + (i * 20)
         row_tokens = [
-            Token(text=f"Product{i}", x=50, y=y_pos, width=200, height=12, page=sample_page),
-            Token(text="5", x=300, y=y_pos, width=20, height=12, page=sample_page),
-            Token(text="100.00", x=450, y=y_pos, width=60, height=12, page=sample_page),
-            Token(text="25.00", x=520, y=y_pos, width=40, height=12, page=sample_page),  # VAT%
-            Token(text="500.00", x=550, y=y_pos, width=60, height=12, page=sample_page),  # Netto
+            Token(text=f"Product{i}", x=50, y=y_pos, width=200, height=12, page=blank_page),
+            Token(text="5", x=300, y=y_pos, width=20, height=12, page=blank_page),
+            Token(text="100.00", x=450, y=y_pos, width=60, height=12, page=blank_page),
+            Token(text="25.00", x=520, y=y_pos, width=40, height=12, page=blank_page),  # VAT%
+            Token(text="500.00", x=550, y=y_pos, width=60, height=12, page=blank_page),  # Netto
         ]
         row = Row(
             tokens=row_tokens,
@@ -66,22 +93,22 @@ def large_table(sample_page):
             x_min=50,
             x_max=610,
             text=f"Product{i} 5 100.00 25.00 500.00",
-            page=sample_page
+            page=blank_page
         )
         rows.append(row)
     
-    return rows
+    return tuple(rows)
 
 
-@pytest.fixture
-def medium_table(sample_page):
-    """Create a medium table with 20 rows for performance testing."""
+@pytest.fixture(scope="module")
+def medium_table(blank_page):
+    """Create a medium table with 20 rows for performance testing (read-only tuple)."""
     rows = []
     
     # Header row
     header_tokens = [
-        Token(text="Benämning", x=50, y=250, width=200, height=12, page=sample_page),
-        Token(text="Nettobelopp", x=550, y=250, width=100, height=12, page=sample_page),
+        Token(text="Benämning", x=50, y=250, width=200, height=12, page=blank_page),
+        Token(text="Nettobelopp", x=550, y=250, width=100, height=12, page=blank_page),
     ]
     header_row = Row(
         tokens=header_tokens,
@@ -89,7 +116,7 @@ def medium_table(sample_page):
         x_min=50,
         x_max=650,
         text="Benämning Nettobelopp",
-        page=sample_page
+        page=blank_page
     )
     rows.append(header_row)
     
@@ -97,8 +124,8 @@ def medium_table(sample_page):
     for i in range(20):
         y_pos = 280 + (i * 20)
         row_tokens = [
-            Token(text=f"Product{i}", x=50, y=y_pos, width=200, height=12, page=sample_page),
-            Token(text="500.00", x=550, y=y_pos, width=60, height=12, page=sample_page),
+            Token(text=f"Product{i}", x=50, y=y_pos, width=200, height=12, page=blank_page),
+            Token(text="500.00", x=550, y=y_pos, width=60, height=12, page=blank_page),
         ]
         row = Row(
             tokens=row_tokens,
@@ -106,62 +133,44 @@ def medium_table(sample_page):
             x_min=50,
             x_max=610,
             text=f"Product{i} 500.00",
-            page=sample_page
+            page=blank_page
         )
         rows.append(row)
     
-    return rows
+    return tuple(rows)
 
 
 class TestColumnDetectionPerformance:
     """Performance tests for column detection."""
     
-    def test_column_detection_performance_medium_table(self, medium_table):
+    def test_column_detection_performance_medium_table(self, benchmark, medium_table):
         """Test that column detection is <5ms for medium table (20 rows)."""
-        # Warmup
-        detect_columns_gap_based(medium_table)
-        
-        # Measure
-        start = time.perf_counter()
-        for _ in range(100):  # Run 100 times for better accuracy
-            detect_columns_gap_based(medium_table)
-        end = time.perf_counter()
-        
-        avg_time_ms = ((end - start) / 100) * 1000
+        benchmark.extra_info["rows"] = len(medium_table)
+        benchmark(detect_columns_gap_based, medium_table)
         
         # Should be <5ms per table
-        assert avg_time_ms < 5.0, f"Column detection took {avg_time_ms:.2f}ms (target: <5ms)"
-        print(f"Column detection (20 rows): {avg_time_ms:.2f}ms")
+        _assert_mean_below(benchmark, 5.0, "Column detection")
     
-    def test_column_detection_performance_large_table(self, large_table):
+    def test_column_detection_performance_large_table(self, benchmark, large_table):
         """Test that column detection is <5ms for large table (50 rows)."""
-        # Warmup
-        detect_columns_gap_based(large_table)
-        
-        # Measure
-        start = time.perf_counter()
-        for _ in range(100):
-            detect_columns_gap_based(large_table)
-        end = time.perf_counter()
-        
-        avg_time_ms = ((end - start) / 100) * 1000
+        benchmark.extra_info["rows"] = len(large_table)
+        benchmark(detect_columns_gap_based, large_table)
         
         # Should be <5ms per table (even for large tables)
-        assert avg_time_ms < 5.0, f"Column detection took {avg_time_ms:.2f}ms (target: <5ms)"
-        print(f"Column detection (50 rows): {avg_time_ms:.2f}ms")
+        _assert_mean_below(benchmark, 5.0, "Column detection")
 
 
 class TestTokenAssignmentPerformance:
     """Performance tests for token-to-column assignment."""
     
-    def test_token_assignment_performance(self, sample_page):
+    def test_token_assignment_performance(self, benchmark, blank_page):
         """Test that token assignment is <2ms per row."""
         # Create a row with multiple tokens
         row_tokens = [
-            Token(text="Product", x=50, y=300, width=200, height=12, page=sample_page),
-            Token(text="5", x=300, y=300, width=20, height=12, page=sample_page),
-            Token(text="100.00", x=450, y=300, width=60, height=12, page=sample_page),
-            Token(text="500.00", x=550, y=300, width=60, height=12, page=sample_page),
+            Token(text="Product", x=50, y=300, width=200, height=12, page=blank_page),
+            Token(text="5", x=300, y=300, width=20, height=12, page=blank_page),
+            Token(text="100.00", x=450, y=300, width=60, height=12, page=blank_page),
+            Token(text="500.00", x=550, y=300, width=60, height=12, page=blank_page),
         ]
         row = Row(
             tokens=row_tokens,
@@ -169,96 +178,68 @@ class TestTokenAssignmentPerformance:
             x_min=50,
             x_max=610,
             text="Product 5 100.00 500.00",
-            page=sample_page
+            page=blank_page
         )
         
         column_centers = [100.0, 310.0, 480.0, 580.0]
         
-        # Warmup
-        assign_tokens_to_columns(row, column_centers)
-        
-        # Measure
-        start = time.perf_counter()
-        for _ in range(1000):  # Run 1000 times for better accuracy
-            assign_tokens_to_columns(row, column_centers)
-        end = time.perf_counter()
-        
-        avg_time_ms = ((end - start) / 1000) * 1000
+        benchmark(assign_tokens_to_columns, row, column_centers)
         
         # Should be <2ms per row
-        assert avg_time_ms < 2.0, f"Token assignment took {avg_time_ms:.3f}ms (target: <2ms)"
-        print(f"Token assignment per row: {avg_time_ms:.3f}ms")
+        _assert_mean_below(benchmark, 2.0, "Token assignment")
 
 
 class TestModeBPerformance:
     """Performance tests for Mode B parsing."""
     
-    def test_mode_b_performance_medium_table(self, sample_page, medium_table):
+    def test_mode_b_performance_medium_table(self, benchmark, blank_page, medium_table):
         """Test that Mode B parsing is <50ms for medium table (20 rows)."""
         segment = Segment(
             segment_type="items",
             rows=medium_table,
             y_min=250,
             y_max=680,
-            page=sample_page
+            page=blank_page
         )
         
-        # Warmup
-        extract_invoice_lines_mode_b(segment)
-        
-        # Measure
-        start = time.perf_counter()
-        for _ in range(10):  # Run 10 times
-            extract_invoice_lines_mode_b(segment)
-        end = time.perf_counter()
-        
-        avg_time_ms = ((end - start) / 10) * 1000
+        benchmark.extra_info["rows"] = len(medium_table)
+        benchmark.pedantic(extract_invoice_lines_mode_b, args=(segment,), rounds=10, warmup_rounds=1)
         
         # Should be <50ms per invoice
-        assert avg_time_ms < 50.0, f"Mode B parsing took {avg_time_ms:.2f}ms (target: <50ms)"
-        print(f"Mode B parsing (20 rows): {avg_time_ms:.2f}ms")
+        _assert_mean_below(benchmark, 50.0, "Mode B parsing")
     
-    def test_mode_b_performance_large_table(self, sample_page, large_table):
+    def test_mode_b_performance_large_table(self, benchmark, blank_page, large_table):
         """Test that Mode B parsing is <50ms for large table (50 rows)."""
         segment = Segment(
             segment_type="items",
             rows=large_table,
             y_min=250,
             y_max=1280,
-            page=sample_page
+            page=blank_page
         )
         
-        # Warmup
-        extract_invoice_lines_mode_b(segment)
-        
-        # Measure
-        start = time.perf_counter()
-        for _ in range(10):
-            extract_invoice_lines_mode_b(segment)
-        end = time.perf_counter()
-        
-        avg_time_ms = ((end - start) / 10) * 1000
+        benchmark.extra_info["rows"] = len(large_table)
+        benchmark.pedantic(extract_invoice_lines_mode_b, args=(segment,), rounds=10, warmup_rounds=1)
         
         # Should be <50ms per invoice (even for large tables)
-        assert avg_time_ms < 50.0, f"Mode B parsing took {avg_time_ms:.2f}ms (target: <50ms)"
-        print(f"Mode B parsing (50 rows): {avg_time_ms:.2f}ms")
+        _assert_mean_below(benchmark, 50.0, "Mode B parsing")
 
 
 class TestValidationPerformance:
     """Performance tests for validation."""
     
-    def test_validation_performance(self, sample_page):
+    def test_validation_performance(self, benchmark, blank_page):
         """Test that validation is <5ms per invoice."""
         from src.models.invoice_line import InvoiceLine
         
         # Create a dummy row for segment
         dummy_row = Row(
-            tokens=[Token(text="Dummy", x=50, y=300, width=50, height=12, page=sample_page)],
+            tokens=[Token(text="Dummy", x=50, y=300, width=50, height=12, page=blank_page)],
             y=300,
             x_min=50,
             x_max=100,
             text="Dummy",
-            page=sample_page
+            page=blank_page
         )
         
         # Create 20 invoice lines
@@ -267,18 +248,18 @@ class TestValidationPerformance:
             rows=[dummy_row],
             y_min=300,
             y_max=700,
-            page=sample_page
+            page=blank_page
         )
         
         invoice_lines = []
         for i in range(20):
             row = Row(
-                tokens=[Token(text=f"Product{i}", x=50, y=300 + i * 20, width=100, height=12, page=sample_page)],
+                tokens=[Token(text=f"Product{i}", x=50, y=300 + i * 20, width=100, height=12, page=blank_page)],
                 y=300 + i * 20,
                 x_min=50,
                 x_max=150,
                 text=f"Product{i}",
-                page=sample_page
+                page=blank_page
             )
             line = InvoiceLine(
                 rows=[row],
@@ -291,26 +272,17 @@ class TestValidationPerformance:
         
         netto_total = Decimal("10000.00")
         
-        # Warmup
-        validate_netto_sum(invoice_lines, netto_total)
-        
-        # Measure
-        start = time.perf_counter()
-        for _ in range(1000):  # Run 1000 times
-            validate_netto_sum(invoice_lines, netto_total)
-        end = time.perf_counter()
-        
-        avg_time_ms = ((end - start) / 1000) * 1000
+        benchmark.extra_info["lines"] = len(invoice_lines)
+        benchmark(validate_netto_sum, invoice_lines, netto_total)
         
         # Should be <5ms per invoice
-        assert avg_time_ms < 5.0, f"Validation took {avg_time_ms:.3f}ms (target: <5ms)"
-        print(f"Validation (20 lines): {avg_time_ms:.3f}ms")
+        _assert_mean_below(benchmark, 5.0, "Validation")
 
 
 class TestModeBOverhead:
     """Test Mode B overhead compared to Mode A."""
     
-    def test_mode_b_overhead_acceptable(self, sample_page, medium_table):
+    def test_mode_b_overhead_acceptable(self, blank_page, medium_table):
         """Test that Mode B overhead is acceptable (<50ms)."""
         from src.pipeline.invoice_line_parser import extract_invoice_lines
         
@@ -319,7 +291,7 @@ class TestModeBOverhead:
             rows=medium_table,
             y_min=250,
             y_max=680,
-            page=sample_page
+            page=blank_page
         )
         
         # Measure Mode A
@@ -116,6 +116,32 @@ class TestLoadProfile:
         with patch('src.config.profile_loader.get_profiles_dir', return_value=profiles_dir):
             with pytest.raises(ValueError):
                 load_profile("invalid")
+    
+    def test_load_profile_cached_until_file_changes(self, tmp_path):
+        """Repeat loads reuse the parsed file; an edit (new mtime) is re-read."""
+        import os
+        
+        profiles_dir = tmp_path / "profiles"
+        profiles_dir.mkdir()
+        profile_path = profiles_dir / "cached.yaml"
+        profile_path.write_text(yaml.dump({"name": "cached", "table_parser_mode": "text"}), encoding='utf-8')
+        
+        with patch('src.config.profile_loader.get_profiles_dir', return_value=profiles_dir), \
+                patch('src.config.profile_loader.yaml.load', wraps=yaml.load) as yaml_load:
+            first = load_profile("cached")
+            first.table_parser_mode = "pos"
+            second = load_profile("cached")
+            
+            assert yaml_load.call_count == 1
+            # Changes to one returned profile do not leak into the next load
+            assert second.table_parser_mode == "text"
+            
+            profile_path.write_text(yaml.dump({"name": "edited"}), encoding='utf-8')
+            stat = profile_path.stat()
+            os.utime(profile_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            
+            assert load_profile("cached").name == "edited"
+            assert yaml_load.call_count == 2
 
 
 class TestProfileManager:
@@ -1,13 +1,13 @@
 """Unit tests for quality score calculation."""
 
+from types import SimpleNamespace
+
 import pytest
 
 from src.models.invoice_header import InvoiceHeader
 from src.models.invoice_line import InvoiceLine
 from src.models.validation_result import ValidationResult
-from src.models.segment import Segment
 from src.models.page import Page
-from src.models.row import Row
 from src.quality.score import (
     calculate_quality_score,
     count_missing_fields,
@@ -15,16 +15,19 @@ from src.quality.score import (
 )
 
 
+class _FakeRow:
+    """Stand-in for Row; quality scoring only counts rows per line."""
+    __slots__ = ()
+
+
 class TestCountMissingFields:
     """Test missing fields counting."""
     
     def test_no_missing_fields(self):
         """Test with all fields present."""
         from datetime import date
-        from unittest.mock import Mock
         
-        segment = Mock(spec=Segment)
-        segment.rows = []
+        segment = SimpleNamespace(rows=[])
         header = InvoiceHeader(
             segment=segment,
             invoice_number="INV-123",
@@ -41,10 +44,7 @@ class TestCountMissingFields:
     
     def test_missing_required_fields(self):
         """Test with missing required fields."""
-        from unittest.mock import Mock
-        
-        segment = Mock(spec=Segment)
-        segment.rows = []
+        segment = SimpleNamespace(rows=[])
         header = InvoiceHeader(
             segment=segment,
             invoice_number=None,  # Missing
@@ -60,10 +60,8 @@ class TestCountMissingFields:
     def test_missing_optional_fields(self):
         """Test with missing optional fields only."""
         from datetime import date
-        from unittest.mock import Mock
         
-        segment = Mock(spec=Segment)
-        segment.rows = []
+        segment = SimpleNamespace(rows=[])
         header = InvoiceHeader(
             segment=segment,
             invoice_number="INV-123",
@@ -84,10 +82,8 @@ class TestWrapComplexity:
     
     def test_no_wraps(self):
         """Test with no wrapped lines."""
-        from unittest.mock import Mock
-        
-        row1 = Mock(spec=Row)
-        row2 = Mock(spec=Row)
+        row1 = _FakeRow()
+        row2 = _FakeRow()
         
         line1 = InvoiceLine(rows=[row1], description="Item 1", total_amount=100.0, line_number=1)
         line2 = InvoiceLine(rows=[row2], description="Item 2", total_amount=200.0, line_number=2)
@@ -97,12 +93,10 @@ class TestWrapComplexity:
     
     def test_some_wraps(self):
         """Test with some wrapped lines."""
-        from unittest.mock import Mock
-        
-        row1 = Mock(spec=Row)
-        row2a = Mock(spec=Row)
-        row2b = Mock(spec=Row)
-        row3 = Mock(spec=Row)
+        row1 = _FakeRow()
+        row2a = _FakeRow()
+        row2b = _FakeRow()
+        row3 = _FakeRow()
         
         line1 = InvoiceLine(rows=[row1], description="Item 1", total_amount=100.0, line_number=1)
         line2 = InvoiceLine(rows=[row2a, row2b], description="Item 2 wrapped", total_amount=200.0, line_number=2)
@@ -124,10 +118,8 @@ class TestQualityScore:
     def test_perfect_score(self):
         """Test perfect invoice (OK status, all fields, no diff, no wraps)."""
         from datetime import date
-        from unittest.mock import Mock
         
-        segment = Mock(spec=Segment)
-        segment.rows = []
+        segment = SimpleNamespace(rows=[])
         header = InvoiceHeader(
             segment=segment,
             invoice_number="INV-123",
@@ -140,8 +132,8 @@ class TestQualityScore:
             raw_text="Test"
         )
         
-        row1 = Mock(spec=Row)
-        row2 = Mock(spec=Row)
+        row1 = _FakeRow()
+        row2 = _FakeRow()
         line1 = InvoiceLine(rows=[row1], description="Item 1", total_amount=500.0, line_number=1)
         line2 = InvoiceLine(rows=[row2], description="Item 2", total_amount=500.0, line_number=2)
         
@@ -164,10 +156,8 @@ class TestQualityScore:
     def test_review_status_penalty(self):
         """Test that REVIEW status gives large penalty."""
         from datetime import date
-        from unittest.mock import Mock
         
-        segment = Mock(spec=Segment)
-        segment.rows = []
+        segment = SimpleNamespace(rows=[])
         header = InvoiceHeader(
             segment=segment,
             invoice_number="INV-123",
@@ -178,7 +168,7 @@ class TestQualityScore:
             raw_text="Test"
         )
         
-        row1 = Mock(spec=Row)
+        row1 = _FakeRow()
         line1 = InvoiceLine(rows=[row1], description="Item 1", total_amount=1000.0, line_number=1)
         
         validation = ValidationResult(
@@ -198,10 +188,7 @@ class TestQualityScore:
     
     def test_missing_fields_penalty(self):
         """Test penalty for missing fields."""
-        from unittest.mock import Mock
-        
-        segment = Mock(spec=Segment)
-        segment.rows = []
+        segment = SimpleNamespace(rows=[])
         header = InvoiceHeader(
             segment=segment,
             invoice_number=None,  # Missing
@@ -225,10 +212,8 @@ class TestQualityScore:
     def test_reconciliation_penalty(self):
         """Test penalty for reconciliation differences."""
         from datetime import date
-        from unittest.mock import Mock
         
-        segment = Mock(spec=Segment)
-        segment.rows = []
+        segment = SimpleNamespace(rows=[])
         header = InvoiceHeader(
             segment=segment,
             invoice_number="INV-123",
@@ -239,7 +224,7 @@ class TestQualityScore:
             raw_text="Test"
         )
         
-        row1 = Mock(spec=Row)
+        row1 = _FakeRow()
         line1 = InvoiceLine(rows=[row1], description="Item 1", total_amount=950.0, line_number=1)
         
         validation = ValidationResult(
@@ -261,10 +246,8 @@ class TestQualityScore:
     def test_wrap_complexity_penalty(self):
         """Test penalty for wrap complexity."""
         from datetime import date
-        from unittest.mock import Mock
         
-        segment = Mock(spec=Segment)
-        segment.rows = []
+        segment = SimpleNamespace(rows=[])
         header = InvoiceHeader(
             segment=segment,
             invoice_number="INV-123",
@@ -276,11 +259,11 @@ class TestQualityScore:
         )
         
         # Create lines with many wrapped rows
-        row1a = Mock(spec=Row)
-        row1b = Mock(spec=Row)
-        row1c = Mock(spec=Row)
-        row2a = Mock(spec=Row)
-        row2b = Mock(spec=Row)
+        row1a = _FakeRow()
+        row1b = _FakeRow()
+        row1c = _FakeRow()
+        row2a = _FakeRow()
+        row2b = _FakeRow()
         
         line1 = InvoiceLine(rows=[row1a, row1b, row1c], description="Item 1 wrapped", total_amount=500.0, line_number=1)
         line2 = InvoiceLine(rows=[row2a, row2b], description="Item 2 wrapped", total_amount=500.0, line_number=2)
@@ -302,10 +285,8 @@ class TestQualityScore:
     def test_score_range(self):
         """Test that score is always in valid range (0-100)."""
         from datetime import date
-        from unittest.mock import Mock
         
-        segment = Mock(spec=Segment)
-        segment.rows = []
+        segment = SimpleNamespace(rows=[])
         header = InvoiceHeader(
             segment=segment,
             invoice_number=None,
@@ -332,10 +313,8 @@ class TestQualityScore:
     def test_score_breakdown(self):
         """Test that breakdown contains expected fields."""
         from datetime import date
-        from unittest.mock import Mock
         
-        segment = Mock(spec=Segment)
-        segment.rows = []
+        segment = SimpleNamespace(rows=[])
         header = InvoiceHeader(
             segment=segment,
             invoice_number="INV-123",
@@ -346,7 +325,7 @@ class TestQualityScore:
             raw_text="Test"
         )
         
-        row1 = Mock(spec=Row)
+        row1 = _FakeRow()
         line1 = InvoiceLine(rows=[row1], description="Item 1", total_amount=1000.0, line_number=1)
         
         validation = ValidationResult(
@@ -1,37 +1,10 @@
 """Unit tests for row grouping."""
 
-import pytest
-from src.models.document import Document
-from src.models.page import Page
 from src.models.token import Token
 from src.models.row import Row
 from src.pipeline.row_grouping import group_tokens_to_rows
 
 
-@pytest.fixture
-def sample_page():
-    """Create a sample Page for testing."""
-    doc = Document(
-        filename="test.pdf",
-        filepath="/path/to/test.pdf",
-        page_count=0,
-        pages=[],
-        metadata={}
-    )
-    
-    page = Page(
-        page_number=1,
-        document=doc,
-        width=595.0,
-        height=842.0,
-        tokens=[],
-        rendered_image_path=None
-    )
-    
-    doc.pages = [page]
-    return page
-
-
 def test_group_tokens_by_y_position(sample_page):
     """Test that tokens are grouped into rows by Y-position."""
     # Create tokens at different Y positions
@@ -1,38 +1,12 @@
 """Unit tests for segment identification."""
 
 import pytest
-from src.models.document import Document
-from src.models.page import Page
 from src.models.row import Row
 from src.models.segment import Segment
 from src.models.token import Token
 from src.pipeline.segment_identification import identify_segments
 
 
-@pytest.fixture
-def sample_page():
-    """Create a sample Page for testing."""
-    doc = Document(
-        filename="test.pdf",
-        filepath="/path/to/test.pdf",
-        page_count=0,
-        pages=[],
-        metadata={}
-    )
-    
-    page = Page(
-        page_number=1,
-        document=doc,
-        width=595.0,
-        height=842.0,  # A4 height
-        tokens=[],
-        rendered_image_path=None
-    )
-    
-    doc.pages = [page]
-    return page
-
-
 @pytest.fixture
 def sample_rows(sample_page):
     """Create sample rows at different Y positions."""
@@ -3,8 +3,6 @@
 from decimal import Decimal
 
 import pytest
-from src.models.document import Document
-from src.models.page import Page
 from src.models.row import Row
 from src.models.token import Token
 from src.pipeline.wrap_detection import (
@@ -15,30 +13,6 @@ from src.pipeline.wrap_detection import (
 )
 
 
-@pytest.fixture
-def sample_page():
-    """Create a sample Page for testing."""
-    doc = Document(
-        filename="test.pdf",
-        filepath="/path/to/test.pdf",
-        page_count=0,
-        pages=[],
-        metadata={}
-    )
-    
-    page = Page(
-        page_number=1,
-        document=doc,
-        width=595.0,
-        height=842.0,
-        tokens=[],
-        rendered_image_path=None
-    )
-    
-    doc.pages = [page]
-    return page
-
-
 # ============================================================================
 # Unit Tests: Adaptive Y-threshold calculation
 # ============================================================================